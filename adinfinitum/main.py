@@ -3,23 +3,30 @@ import logging
 import os
 import random
 import re
+import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import TypeVar
+from typing import ClassVar, Literal, TypeVar
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.firefox.service import Service
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    InsecureCertificateException,
+    TimeoutException,
+    WebDriverException,
+)
 
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
+    format="%(asctime)s [%(levelname)s] [%(threadName)s] %(message)s",
     datefmt="%H:%M:%S",
     stream=sys.stdout,
 )
@@ -35,7 +42,8 @@ class Settings(BaseModel):
 
     All fields have sensible defaults and can be overridden by subclassing
     or passing kwargs. The `xpi_path` field respects the ADNAUSEAM_XPI
-    environment variable.
+    environment variable, `profile_template` respects PROFILE_TEMPLATE,
+    `headless` respects HEADLESS and `workers` respects WORKERS.
     """
 
     xpi_path: Path = Path(os.getenv("ADNAUSEAM_XPI", "/extensions/adnauseam.xpi"))
@@ -44,6 +52,11 @@ class Settings(BaseModel):
     profile_dir: Path = Path("/tmp/adnauseam_profile")
     """Firefox profile directory used across sessions."""
 
+    profile_template: Path | None = (
+        Path(os.environ["PROFILE_TEMPLATE"]) if os.getenv("PROFILE_TEMPLATE") else None
+    )
+    """Pre-built profile copied into an empty profile_dir to skip the add-on install."""
+
     heartbeat_file: Path = Path("/tmp/heartbeat")
     """Touched periodically so the Docker healthcheck knows the process is alive."""
 
@@ -53,6 +66,12 @@ class Settings(BaseModel):
     geckodriver_path: Path = Path("/usr/local/bin/geckodriver")
     """Path to the geckodriver binary."""
 
+    headless: bool = os.getenv("HEADLESS", "0") == "1"
+    """Run Firefox in native headless mode instead of on a display; respects HEADLESS=1."""
+
+    geckodriver_port: int = Field(default=0, ge=0, le=65535)
+    """Port for geckodriver; 0 lets Selenium pick a free one. Workers count up from it."""
+
     filter_poll_interval: int = Field(default=5, ge=1)
     """Seconds between each poll of the AdNauseam filter list readiness check."""
 
@@ -77,8 +96,23 @@ class Settings(BaseModel):
     scroll_pause_max: float = Field(default=7.0, ge=0)
     """Maximum pause in seconds between scroll steps."""
 
-    session_restart_interval: int = Field(default=25, ge=1)
-    """Number of sessions between scheduled browser restarts."""
+    session_restart_interval: int = Field(default=50, ge=0)
+    """Sessions between scheduled browser restarts; 0 restarts on memory only."""
+
+    vault_scrape_interval: int = Field(default=5, ge=1)
+    """Sessions between vault stats scrapes; the vault renders every collected ad."""
+
+    memory_minimize_interval: int = Field(default=5, ge=1)
+    """Number of sessions between in-place Firefox memory minimisations."""
+
+    restart_rss_mb: int = Field(default=1500, ge=100)
+    """Restart the browser early once its process tree's RSS exceeds this many MB."""
+
+    http_cache_mb: int = Field(default=512, ge=0)
+    """Disk cache size in MB, kept in the persistent profile across restarts."""
+
+    block_media: bool = False
+    """Block images, autoplay, WebRTC and the disk cache to cut per-visit bandwidth."""
 
     page_load_timeout: int = Field(default=45, ge=5)
     """Default page load timeout in seconds."""
@@ -86,6 +120,66 @@ class Settings(BaseModel):
     default_urls: list[str] = ["https://www.yahoo.com"]
     """Fallback seed URL list used when urls.json is absent or unreadable."""
 
+    workers: int = Field(
+        default=int(os.getenv("WORKERS", "1")), ge=1, validate_default=True
+    )
+    """Number of concurrent browsing sessions, each with its own Firefox and geckodriver."""
+
+    worker_start_stagger: float = Field(default=2.0, ge=0)
+    """Seconds between worker launches, so Firefox boots do not all land at once."""
+
+    random_seed: int | None = None
+    """Seed for URL choice and scroll sampling; None draws fresh entropy each run."""
+
+    @model_validator(mode="after")
+    def _check_worker_ports(self) -> "Settings":
+        """
+        Reject a fixed geckodriver port whose per-worker offsets overflow.
+
+        for_worker() offsets the port by the worker index without
+        re-validating, so the whole range is checked here up front.
+
+        Returns:
+            The validated settings.
+
+        Raises:
+            ValueError: If geckodriver_port + workers - 1 exceeds 65535.
+        """
+        if self.geckodriver_port and self.geckodriver_port + self.workers - 1 > 65535:
+            raise ValueError(
+                f"geckodriver_port {self.geckodriver_port} leaves no room for "
+                f"{self.workers} workers below port 65535"
+            )
+        return self
+
+    def for_worker(self, worker_id: int) -> "Settings":
+        """
+        Return settings scoped to a single worker.
+
+        Each worker needs its own Firefox profile directory, since Firefox
+        locks a profile while it is in use, and its own random seed so seeded
+        workers do not all browse in lockstep. A fixed geckodriver port is
+        offset per worker, since one geckodriver serves only one session.
+        With a single worker the settings are returned unchanged.
+
+        Args:
+            worker_id: Zero-based index of the worker.
+
+        Returns:
+            A Settings instance for the given worker.
+        """
+        if self.workers == 1:
+            return self
+        seed = None if self.random_seed is None else self.random_seed + worker_id
+        port = self.geckodriver_port + worker_id if self.geckodriver_port else 0
+        return self.model_copy(
+            update={
+                "profile_dir": self.profile_dir / f"worker-{worker_id}",
+                "random_seed": seed,
+                "geckodriver_port": port,
+            }
+        )
+
 
 class BrowserManager:
     """
@@ -97,15 +191,53 @@ class BrowserManager:
     and geckodriver processes before starting fresh.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    MINIMIZE_MEMORY_SCRIPT: str = """
+    const done = arguments[arguments.length - 1];
+    const mgr = Cc["@mozilla.org/memory-reporter-manager;1"]
+        .getService(Ci.nsIMemoryReporterManager);
+    Services.obs.notifyObservers(null, "child-mmu-request");
+    mgr.minimizeMemoryUsage(() => done(true));
+    """
+    """Chrome-context script equivalent to about:memory's "Minimize memory usage"."""
+
+    PREFERENCES: ClassVar[dict[str, bool | int | str]] = {
+        "extensions.enabledScopes": 15,
+        "extensions.autoDisableScopes": 0,
+        "extensions.startupScanPolicy": 0,
+        "xpinstall.signatures.required": False,
+        "privacy.resistFingerprinting": False,
+        "dom.ipc.processCount": 1,
+        "javascript.options.mem.gc_allocation_threshold_mb": 3,
+        "browser.sessionhistory.max_total_viewers": 0,
+        "browser.sessionhistory.max_entries": 5,
+        "browser.cache.disk.enable": True,
+        "browser.cache.disk.smart_size.enabled": False,
+    }
+    """Firefox preferences baked into the profile's user.js."""
+
+    MEDIA_BLOCKING_PREFERENCES: ClassVar[dict[str, bool | int | str]] = {
+        "permissions.default.image": 2,
+        "media.autoplay.default": 5,
+        "media.peerconnection.enabled": False,
+        "browser.cache.disk.enable": False,
+    }
+    """Extra preferences applied when Settings.block_media is enabled."""
+
+    def __init__(
+        self, settings: Settings, stop_event: threading.Event | None = None
+    ) -> None:
         """
         Initialise the BrowserManager.
 
         Args:
             settings: Validated AdInfinitum settings instance.
+            stop_event: Set on shutdown; once set, no new browser is booted.
         """
         self.settings = settings
+        self.stop_event: threading.Event = stop_event or threading.Event()
         self.driver: webdriver.Firefox | None = None
+        self._orphans_cleared: bool = False
+        self._stop_lock: threading.Lock = threading.Lock()
 
     def _kill_orphans(self) -> None:
         """Kill any lingering Firefox and geckodriver processes from previous runs."""
@@ -117,42 +249,131 @@ class BrowserManager:
         """
         Construct Firefox options for headless operation with the AdNauseam profile.
 
+        Preferences are not set here; they live in the profile's user.js.
+
         Returns:
             A configured Firefox Options instance.
         """
         opts = Options()
+        opts.page_load_strategy = "eager"
+        opts.timeouts = {"pageLoad": self.settings.page_load_timeout * 1000}
+        if self.settings.headless:
+            opts.add_argument("-headless")
         opts.add_argument("--no-sandbox")
         opts.add_argument("--disable-dev-shm-usage")
         opts.add_argument("--width=1920")
         opts.add_argument("--height=1080")
         opts.add_argument("-profile")
         opts.add_argument(str(self.settings.profile_dir))
-        opts.set_preference("extensions.enabledScopes", 15)
-        opts.set_preference("extensions.autoDisableScopes", 0)
-        opts.set_preference("extensions.startupScanPolicy", 0)
-        opts.set_preference("privacy.resistFingerprinting", False)
-        opts.set_preference("dom.ipc.processCount", 1)
+        opts.add_argument("-remote-allow-system-access")
         return opts
 
+    def _seed_profile(self) -> None:
+        """
+        Copy profile_template into profile_dir when the profile is empty.
+
+        A template that already has AdNauseam installed and its filter lists
+        downloaded lets a fresh container (whose profile tmpfs starts empty)
+        boot straight into a ready browser. Firefox's lock files are left
+        behind so the copy is never mistaken for a profile in use.
+        """
+        template = self.settings.profile_template
+        if template is None or any(self.settings.profile_dir.iterdir()):
+            return
+        log.info(f"Seeding profile from {template}")
+        shutil.copytree(
+            template,
+            self.settings.profile_dir,
+            dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns("lock", ".parentlock"),
+        )
+
+    def _write_user_prefs(self) -> None:
+        """
+        Write PREFERENCES into the profile's user.js.
+
+        Firefox applies user.js on every launch, so the preferences only need
+        to be written once per profile rather than serialised through the
+        driver options on every start. The disk cache is sized from
+        http_cache_mb and, since it lives in the persistent profile, survives
+        restarts. MEDIA_BLOCKING_PREFERENCES are added when block_media is
+        enabled. The file is left untouched when it already matches.
+        """
+        user_js = self.settings.profile_dir / "user.js"
+        prefs = dict(self.PREFERENCES)
+        prefs["browser.cache.disk.capacity"] = self.settings.http_cache_mb * 1024
+        if self.settings.block_media:
+            prefs.update(self.MEDIA_BLOCKING_PREFERENCES)
+        content = "".join(
+            f"user_pref({json.dumps(name)}, {json.dumps(value)});\n"
+            for name, value in prefs.items()
+        )
+        if not user_js.is_file() or user_js.read_text() != content:
+            user_js.write_text(content)
+
+    def _addon_installed(self) -> bool:
+        """
+        Check whether AdNauseam is already installed in the persistent profile.
+
+        Returns:
+            True if the profile contains the installed extension package.
+        """
+        addon = (
+            self.settings.profile_dir
+            / "extensions"
+            / f"{AdNauseamController.EXTENSION_ID}.xpi"
+        )
+        return addon.is_file()
+
     def start(self) -> bool:
         """
         Boot Firefox, inject AdNauseam, and prepare the driver for use.
 
+        AdNauseam is installed permanently into the profile on first boot, so
+        later restarts against the same profile load it with Firefox and skip
+        the install entirely. An empty profile is first seeded from
+        profile_template when one is configured.
+
+        Orphaned processes from earlier runs are cleared on the first start
+        only, and only when running a single worker; with several workers a
+        blanket pkill would take down sibling browsers, so main() clears them
+        once before any worker starts. On restarts stop() has already reaped
+        this manager's own processes.
+
+        Once the stop event is set no browser is booted, and one that finishes
+        booting after shutdown began is quit straight away, since main() may
+        already have stopped this manager while the boot was in flight.
+
         Returns:
             True if the browser started successfully, False otherwise.
         """
-        self._kill_orphans()
+        if self.stop_event.is_set():
+            return False
+        if self.settings.workers == 1 and not self._orphans_cleared:
+            self._kill_orphans()
+            self._orphans_cleared = True
         self.settings.profile_dir.mkdir(parents=True, exist_ok=True)
 
         log.info("Booting Firefox...")
         try:
-            service = Service(executable_path=str(self.settings.geckodriver_path))
+            self._seed_profile()
+            self._write_user_prefs()
+            service = Service(
+                executable_path=str(self.settings.geckodriver_path),
+                port=self.settings.geckodriver_port,
+            )
             self.driver = webdriver.Firefox(
                 options=self._build_options(),
                 service=service,
             )
-            log.info("Injecting AdNauseam...")
-            self.driver.install_addon(str(self.settings.xpi_path), temporary=True)
+            if self.stop_event.is_set():
+                self.stop()
+                return False
+            if self._addon_installed():
+                log.info("AdNauseam already installed in profile")
+            else:
+                log.info("Injecting AdNauseam...")
+                self.driver.install_addon(str(self.settings.xpi_path))
             return True
         except Exception as e:
             log.error(f"Boot failed: {e}")
@@ -160,12 +381,27 @@ class BrowserManager:
             return False
 
     def stop(self) -> None:
-        """Quit the WebDriver and clear the driver reference."""
-        if self.driver:
+        """
+        Quit the WebDriver and clear the driver reference.
+
+        The geckodriver process tree is recorded before quitting and any
+        process that outlives quit() is killed by PID, so a hung Firefox is
+        cleaned up without resorting to pkill. Safe to call from another
+        thread during shutdown.
+        """
+        with self._stop_lock:
+            if not self.driver:
+                return
+            tree = self._process_tree(self.driver.service.process.pid)
             try:
                 self.driver.quit()
             except Exception:
                 pass
+            for pid in tree:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except OSError:
+                    pass
             self.driver = None
 
     def restart(self) -> bool:
@@ -179,9 +415,95 @@ class BrowserManager:
         self.stop()
         return self.start()
 
+    def minimize_memory(self) -> bool:
+        """
+        Ask Firefox to release as much memory as it can without restarting.
+
+        Runs the same routine as the "Minimize memory usage" button on
+        about:memory (repeated GC and CC passes in every process) from the
+        chrome context, which is far cheaper than a full browser restart.
+
+        Returns:
+            True if the minimisation completed, False otherwise.
+        """
+        if not self.driver:
+            return False
+        try:
+            with self.driver.context(self.driver.CONTEXT_CHROME):
+                self.driver.execute_async_script(self.MINIMIZE_MEMORY_SCRIPT)
+            return True
+        except WebDriverException as e:
+            log.warning(f"Memory minimisation failed: {e.msg}")
+            return False
+
+    @staticmethod
+    def _process_tree(root_pid: int, proc_dir: Path = Path("/proc")) -> dict[int, int]:
+        """
+        Find a process and all of its descendants.
+
+        Reads /proc/<pid>/stat directly so no extra dependency is needed.
+        Processes that vanish mid-scan are skipped.
+
+        Args:
+            root_pid: PID at the top of the process tree.
+            proc_dir: The procfs mount to read from.
+
+        Returns:
+            A mapping of each live PID in the tree to its RSS in pages.
+        """
+        parents: dict[int, int] = {}
+        pages: dict[int, int] = {}
+        for stat_file in proc_dir.glob("[0-9]*/stat"):
+            try:
+                # Fields after the parenthesised command name: state, ppid, ...
+                fields = stat_file.read_text().rsplit(")", 1)[1].split()
+                pid = int(stat_file.parent.name)
+                parents[pid] = int(fields[1])
+                pages[pid] = int(fields[21])
+            except (OSError, IndexError, ValueError):
+                continue
+        tree = {root_pid}
+        grew = True
+        while grew:
+            children = {pid for pid, ppid in parents.items() if ppid in tree}
+            grew = not children <= tree
+            tree |= children
+        return {pid: pages[pid] for pid in tree if pid in pages}
+
+    @staticmethod
+    def _process_tree_rss(root_pid: int, proc_dir: Path = Path("/proc")) -> int:
+        """
+        Sum the resident set size of a process and all of its descendants.
+
+        Args:
+            root_pid: PID at the top of the process tree.
+            proc_dir: The procfs mount to read from.
+
+        Returns:
+            Total RSS in bytes, or 0 if the tree cannot be read.
+        """
+        tree = BrowserManager._process_tree(root_pid, proc_dir)
+        return sum(tree.values()) * os.sysconf("SC_PAGE_SIZE")
+
+    def rss_bytes(self) -> int | None:
+        """
+        Measure the memory held by geckodriver and the Firefox processes it spawned.
+
+        Returns:
+            Total RSS in bytes, or None if no driver is running.
+        """
+        if not self.driver:
+            return None
+        return self._process_tree_rss(self.driver.service.process.pid)
+
     def get(self, url: str) -> bool:
         """
-        Navigate to a URL, respecting the configured page load timeout.
+        Navigate to a URL within the driver's current page load timeout.
+
+        The driver uses the eager page load strategy, so this returns once the
+        DOM is ready rather than waiting for every ad and tracker to finish.
+        The timeout is part of the session capabilities, so no extra command
+        is sent per navigation.
 
         Args:
             url: The URL to navigate to.
@@ -191,7 +513,6 @@ class BrowserManager:
         """
         if not self.driver:
             return False
-        self.driver.set_page_load_timeout(self.settings.page_load_timeout)
         try:
             self.driver.get(url)
             return True
@@ -231,15 +552,96 @@ class BrowserManager:
             return result
         return None
 
-    def set_page_load_timeout(self, seconds: int) -> None:
+    def execute_chrome_script(
+        self, return_type: type[T], script: str, *args: object
+    ) -> T | None:
+        """
+        Execute a JavaScript snippet in Firefox's privileged chrome context.
+
+        Chrome scripts can reach browser internals such as WebExtensionPolicy,
+        which the -remote-allow-system-access flag makes available.
+
+        Args:
+            return_type: The Python type expected back from the script.
+            script: JavaScript source to execute.
+            *args: Optional positional arguments forwarded to the script.
+
+        Returns:
+            The script's return value, or ``None`` if the driver is unavailable
+            or the result is not an instance of ``return_type``.
+        """
+        if not self.driver:
+            return None
+        with self.driver.context(self.driver.CONTEXT_CHROME):
+            return self.execute_script(return_type, script, *args)
+
+    def execute_async_script(
+        self, return_type: type[T], script: str, *args: object
+    ) -> T | None:
+        """
+        Execute an asynchronous JavaScript snippet in the current browser context.
+
+        The script receives a completion callback as its last argument and the
+        call blocks until the script invokes it or the script timeout elapses.
+        This lets a whole sequence of timed actions run inside the browser for
+        the cost of a single WebDriver round-trip.
+
+        Args:
+            return_type: The Python type expected back from the script. Pass
+                ``type(None)`` when no return value is needed.
+            script: JavaScript source to execute.
+            *args: Optional positional arguments forwarded to the script.
+
+        Returns:
+            The value passed to the callback cast to ``T``, or ``None`` if the
+            driver is unavailable or the result is not an instance of ``return_type``.
+        """
+        if not self.driver:
+            return None
+        result = self.driver.execute_async_script(script, *args)
+        if isinstance(result, return_type):
+            return result
+        return None
+
+    def wait_for_script(
+        self, return_type: type[T], script: str, timeout: float, *args: object
+    ) -> T | None:
         """
-        Update the page load timeout on the active driver.
+        Re-run a JavaScript probe until it returns a truthy ``return_type`` value.
+
+        Replaces a fixed sleep after navigation with an explicit readiness
+        check: the probe is polled every 200ms and the wait ends as soon as
+        the page is ready.
+
+        Args:
+            return_type: The Python type expected back from the script.
+            script: JavaScript source to execute on each poll.
+            timeout: Maximum seconds to keep polling.
+            *args: Optional positional arguments forwarded to the script.
+
+        Returns:
+            The first truthy result, or ``None`` on timeout or missing driver.
+        """
+        if not self.driver:
+            return None
+
+        def probe(_: webdriver.Firefox) -> T | Literal[False]:
+            return self.execute_script(return_type, script, *args) or False
+
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.2).until(probe)
+        except TimeoutException:
+            return None
+
+    def set_script_timeout(self, seconds: float) -> None:
+        """
+        Update the script timeout on the active driver.
 
         Args:
             seconds: Timeout duration in seconds.
         """
         if self.driver:
-            self.driver.set_page_load_timeout(seconds)
+            self.driver.set_script_timeout(seconds)
 
 
 class AdNauseamController:
@@ -257,29 +659,146 @@ class AdNauseamController:
     EXTENSION_ID: str = "adnauseam@rednoise.org"
     """The permanent Firefox extension ID for AdNauseam."""
 
-    def __init__(self, settings: Settings, browser: BrowserManager) -> None:
+    UUID_PREF_PATTERN: re.Pattern[str] = re.compile(
+        r'user_pref\("extensions\.webextensions\.uuids",\s*"(.*?)"\)'
+    )
+    """Matches the extension-ID-to-UUID map that Firefox stores in prefs.js."""
+
+    FILTER_COUNT_PATTERN: re.Pattern[str] = re.compile(r"([\d,]+)\s+network filters")
+    """Extracts the network filter count from the 3p-filters summary text."""
+
+    UUID_CACHE_FILE: str = ".adinfinitum_uuid"
+    """File in the profile directory that caches the discovered UUID across processes."""
+
+    UUID_FORMAT: re.Pattern[str] = re.compile(
+        r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    )
+    """Shape of a valid moz-extension UUID, used to reject a corrupt cache."""
+
+    PREFS_UUID_ATTEMPTS: int = 5
+    """prefs.js reads, one second apart, before falling back to about:debugging."""
+
+    FILTER_RELOAD_POLLS: int = 6
+    """Reload the filter list page on every Nth poll in case it stops refreshing."""
+
+    DEBUGGER_UUID_SCRIPT: str = """
+    const labels = document.querySelectorAll('.debug-target-details-label');
+    for (let label of labels) {
+        if (label.textContent.includes('Internal UUID')) {
+            let parent = label.closest('.debug-target-item');
+            if (parent && parent.textContent.includes('AdNauseam')) {
+                return label.nextElementSibling.textContent.trim();
+            }
+        }
+    }
+    return null;
+    """
+    """Reads the AdNauseam Internal UUID from the about:debugging page."""
+
+    OPTIONS_READY_SCRIPT: str = """
+    const iframe = document.getElementById('iframe');
+    const doc = iframe && iframe.contentDocument;
+    if (!doc || doc.readyState !== 'complete') return false;
+    return ['hidingAds', 'clickingAds', 'blockingMalware']
+        .every(id => doc.getElementById(id) !== null);
+    """
+    """True once the options iframe has loaded and rendered all three toggles."""
+
+    CHROME_UUID_SCRIPT: str = """
+    const policy = WebExtensionPolicy.getByID(arguments[0]);
+    return policy ? policy.mozExtensionHostname : null;
+    """
+    """Reads an extension's internal UUID straight from its WebExtensionPolicy."""
+
+    ACTIVATE_SCRIPT: str = """
+    const iframe = document.getElementById('iframe');
+    if (!iframe) return {error: 'no iframe found'};
+    const doc = iframe.contentDocument || iframe.contentWindow.document;
+    if (!doc) return {error: 'cannot access iframe document'};
+    const settings = ['hidingAds', 'clickingAds', 'blockingMalware'];
+    const results = {};
+    for (const name of settings) {
+        const el = doc.getElementById(name);
+        if (!el) { results[name] = 'not found'; continue; }
+        if (!el.checked) { el.click(); results[name] = 'activated'; }
+        else { results[name] = 'already on'; }
+    }
+    return results;
+    """
+    """Turns on any of hidingAds, clickingAds and blockingMalware that are off."""
+
+    FILTER_PROMPT_SCRIPT: str = """
+    const iframe = document.getElementById('iframe');
+    if (!iframe) return null;
+    const doc = iframe.contentDocument || iframe.contentWindow.document;
+    if (!doc) return null;
+    const el = doc.getElementById('listsOfBlockedHostsPrompt');
+    return el ? el.innerText.trim() : null;
+    """
+    """Returns the filter summary text from the 3p-filters iframe."""
+
+    VAULT_STATS_SCRIPT: str = """
+    const done = arguments[arguments.length - 1];
+    const deadline = Date.now() + arguments[0];
+    function getText(selector) {
+        const el = document.querySelector(selector);
+        return el ? el.innerText.trim() : null;
+    }
+    (function poll() {
+        const stats = {
+            clicked:   getText('span.clicked'),
+            collected: getText('span.total'),
+            showing:   getText('span#detected')
+        };
+        if ((stats.clicked && stats.collected) || Date.now() > deadline) {
+            done(stats);
+        } else {
+            setTimeout(poll, 200);
+        }
+    })();
+    """
+    """Polls vault.html until the stats bar renders, then returns its text."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        browser: BrowserManager,
+        stop_event: threading.Event | None = None,
+    ) -> None:
         """
         Initialise the controller.
 
         Args:
             settings: Validated AdInfinitum settings instance.
             browser: The active BrowserManager to use for navigation and scripting.
+            stop_event: Set on shutdown to cut short any wait in progress.
         """
         self.settings = settings
         self.browser = browser
+        self.stop_event = stop_event or threading.Event()
         self._uuid: str | None = None
         self._activated: bool = False
         self._filters_ready: bool = False
 
-    def reset(self) -> None:
+    def reset(self, keep_profile_state: bool = False) -> None:
         """
         Reset all per-session state.
 
         Called after a browser restart so that UUID discovery, activation,
         and filter polling are re-run against the new driver instance.
+
+        Args:
+            keep_profile_state: Keep the UUID and activation status. Both live
+                in the persistent profile (prefs.js and extension storage),
+                so a planned restart against the same profile can skip
+                re-discovering and re-activating. Filters are always
+                re-checked, since the lists must be reloaded into memory.
+                A full reset also drops the cached UUID, in case it went stale.
         """
-        self._uuid = None
-        self._activated = False
+        if not keep_profile_state:
+            self._uuid = None
+            self._activated = False
+            (self.settings.profile_dir / self.UUID_CACHE_FILE).unlink(missing_ok=True)
         self._filters_ready = False
 
     @property
@@ -306,10 +825,7 @@ class AdNauseamController:
         prefs_file = self.settings.profile_dir / "prefs.js"
         try:
             content = prefs_file.read_text()
-            match = re.search(
-                r'user_pref\("extensions\.webextensions\.uuids",\s*"(.*?)"\)',
-                content,
-            )
+            match = self.UUID_PREF_PATTERN.search(content)
             if match:
                 raw: str = match.group(1).replace('\\"', '"').replace("\\\\", "\\")
                 uuid_map: dict[str, str] = json.loads(raw)
@@ -318,70 +834,132 @@ class AdNauseamController:
             log.debug(f"Prefs UUID lookup failed: {e}")
         return None
 
+    def _uuid_from_chrome(self) -> str | None:
+        """
+        Read the AdNauseam internal UUID from the browser's chrome context.
+
+        Asks Firefox's WebExtensionPolicy for the running extension directly,
+        which answers immediately even before prefs.js has been written.
+
+        Returns:
+            The UUID string, or None if the chrome context is unavailable.
+        """
+        try:
+            return self.browser.execute_chrome_script(
+                str,
+                self.CHROME_UUID_SCRIPT,
+                self.EXTENSION_ID,
+            )
+        except WebDriverException as e:
+            log.debug(f"Chrome UUID lookup failed: {e.msg}")
+            return None
+
     def _uuid_from_debugger(self) -> str | None:
         """
         Discover the AdNauseam UUID by scraping about:debugging.
 
-        Used as a fallback when prefs.js lookup fails. Less reliable due to
-        the async rendering of the debugging UI.
+        Used as a fallback when prefs.js lookup fails. The debugging UI renders
+        asynchronously, so the page is polled until the UUID label appears
+        rather than waited on for a fixed time.
 
         Returns:
             The UUID string, or None if it cannot be found.
         """
         try:
             self.browser.get("about:debugging#/runtime/this-firefox")
-            time.sleep(10)
-            return self.browser.execute_script(
-                str,
-                """
-                const labels = document.querySelectorAll('.debug-target-details-label');
-                for (let label of labels) {
-                    if (label.textContent.includes('Internal UUID')) {
-                        let parent = label.closest('.debug-target-item');
-                        if (parent && parent.textContent.includes('AdNauseam')) {
-                            return label.nextElementSibling.textContent.trim();
-                        }
-                    }
-                }
-                return null;
-            """,
-            )
+            return self.browser.wait_for_script(str, self.DEBUGGER_UUID_SCRIPT, 10)
         except Exception as e:
             log.debug(f"Debugger UUID search failed: {e}")
             return None
 
+    def _uuid_from_cache(self) -> str | None:
+        """
+        Read the UUID saved in the profile by an earlier discovery.
+
+        Returns:
+            The cached UUID, or None if the cache is missing or malformed.
+        """
+        try:
+            cached = (self.settings.profile_dir / self.UUID_CACHE_FILE).read_text()
+        except OSError:
+            return None
+        cached = cached.strip()
+        return cached if self.UUID_FORMAT.fullmatch(cached) else None
+
+    def _save_uuid(self) -> None:
+        """Save the discovered UUID in the profile for later processes to reuse."""
+        if not self._uuid:
+            return
+        try:
+            (self.settings.profile_dir / self.UUID_CACHE_FILE).write_text(self._uuid)
+        except OSError as e:
+            log.debug(f"Could not cache UUID: {e}")
+
+    def _locate_uuid(self) -> str | None:
+        """
+        Look up the UUID from the browser and profile, cheapest method first.
+
+        Tries prefs.js first, then the chrome context, then falls back to
+        about:debugging. Firefox writes prefs.js shortly after the add-on is
+        installed rather than at once, so if the chrome lookup is unavailable
+        the file is re-read a few times before paying for the debugger page.
+
+        Returns:
+            The UUID string, or None if every method failed or a stop was requested.
+        """
+        for attempt in range(self.PREFS_UUID_ATTEMPTS):
+            if attempt and self.stop_event.wait(1):
+                return None
+            uuid = self._uuid_from_prefs()
+            if uuid:
+                log.info("Extension located via prefs.js")
+                return uuid
+            if attempt == 0:
+                uuid = self._uuid_from_chrome()
+                if uuid:
+                    log.info("Extension located via chrome context")
+                    return uuid
+        log.info("Trying fallback detection via about:debugging...")
+        uuid = self._uuid_from_debugger()
+        if uuid:
+            log.info("Extension located via debugger")
+        return uuid
+
     def discover_uuid(self) -> bool:
         """
         Attempt to discover the AdNauseam extension UUID.
 
-        Tries prefs.js first, then falls back to about:debugging. The UUID
-        is stored internally and used to construct all moz-extension:// URLs.
+        A UUID cached in the profile by an earlier process is used when
+        present; otherwise it is located afresh and cached. The UUID is stored
+        internally and used to construct all moz-extension:// URLs.
 
         Returns:
             True if the UUID was found, False otherwise.
         """
         if self._uuid:
             return True
-        log.info("Locating AdNauseam extension...")
-        self._uuid = self._uuid_from_prefs()
-        if self._uuid:
-            log.info("Extension located via prefs.js")
-            return True
-        log.info("Trying fallback detection via about:debugging...")
-        self._uuid = self._uuid_from_debugger()
+        self._uuid = self._uuid_from_cache()
         if self._uuid:
-            log.info("Extension located via debugger")
+            log.info("Extension UUID loaded from profile cache")
             return True
-        log.warning("Extension not found")
-        return False
+        log.info("Locating AdNauseam extension...")
+        self._uuid = self._locate_uuid()
+        if not self._uuid:
+            log.warning("Extension not found")
+            return False
+        self._save_uuid()
+        return True
 
     def activate(self) -> bool:
         """
         Ensure AdNauseam's core features are enabled via the options page.
 
-        Navigates to dashboard.html#options.html, accesses the settings iframe,
-        and clicks any toggles that are off. Confirmed checkbox IDs from live
-        DOM inspection of options.html: hidingAds, clickingAds, blockingMalware.
+        Navigates to dashboard.html#options.html, waits for the settings
+        iframe to render its toggles, and clicks any that are off. Confirmed
+        checkbox IDs from live DOM inspection of options.html: hidingAds,
+        clickingAds, blockingMalware. Activation is only recorded once every
+        toggle has been found, so a page that never rendered is retried on
+        the next setup.
 
         Returns:
             True if activation succeeded, False otherwise.
@@ -390,30 +968,23 @@ class AdNauseamController:
             return self._activated
         options_url = f"moz-extension://{self._uuid}/dashboard.html#options.html"
         try:
-            self.browser.set_page_load_timeout(20)
             self.browser.get(options_url)
-            time.sleep(6)
+            if not self.browser.wait_for_script(bool, self.OPTIONS_READY_SCRIPT, 15):
+                log.warning("Options page did not render its toggles")
+                return False
+            # Toggle state is filled in from the background page after load.
+            self.stop_event.wait(1)
 
             result: dict[str, str] | None = self.browser.execute_script(
                 dict,
-                """
-                const iframe = document.getElementById('iframe');
-                if (!iframe) return {error: 'no iframe found'};
-                const doc = iframe.contentDocument || iframe.contentWindow.document;
-                if (!doc) return {error: 'cannot access iframe document'};
-                const settings = ['hidingAds', 'clickingAds', 'blockingMalware'];
-                const results = {};
-                for (const name of settings) {
-                    const el = doc.getElementById(name);
-                    if (!el) { results[name] = 'not found'; continue; }
-                    if (!el.checked) { el.click(); results[name] = 'activated'; }
-                    else { results[name] = 'already on'; }
-                }
-                return results;
-            """,
+                self.ACTIVATE_SCRIPT,
             )
 
-            if result is not None and "error" not in result:
+            if (
+                result is not None
+                and "error" not in result
+                and "not found" not in result.values()
+            ):
                 enabled = [k for k, v in result.items() if v == "activated"]
                 if enabled:
                     log.info(f"Enabled: {', '.join(enabled)}")
@@ -424,47 +995,42 @@ class AdNauseamController:
                 log.warning(f"Settings check returned unexpected result: {result}")
         except Exception as e:
             log.warning(f"Settings activation failed: {e}")
-        finally:
-            self.browser.set_page_load_timeout(self.settings.page_load_timeout)
 
         return self._activated
 
-    def _get_filter_count(self) -> int:
+    def _get_filter_count(self, reload: bool = True) -> int:
         """
         Read the current network filter count from the AdNauseam filter list page.
 
-        Navigates to dashboard.html#3p-filters.html and reads the
-        #listsOfBlockedHostsPrompt element from inside the iframe.
+        Polls the #listsOfBlockedHostsPrompt element inside the
+        dashboard.html#3p-filters.html iframe until the page has rendered it,
+        rather than sleeping a fixed interval first. The pane re-renders
+        itself as lists finish downloading, so repeat reads can skip the
+        navigation.
 
         Expected text format: "167,399 network filters / 42,753 cosmetic filters from:"
 
+        Args:
+            reload: Navigate to the filter list page before reading it.
+
         Returns:
             The number of loaded network filters, or 0 if not yet available.
         """
         filters_url = f"moz-extension://{self._uuid}/dashboard.html#3p-filters.html"
         try:
-            self.browser.set_page_load_timeout(20)
-            self.browser.get(filters_url)
-            time.sleep(3)
-            text: str | None = self.browser.execute_script(
+            if reload:
+                self.browser.get(filters_url)
+            text: str | None = self.browser.wait_for_script(
                 str,
-                """
-                const iframe = document.getElementById('iframe');
-                if (!iframe) return null;
-                const doc = iframe.contentDocument || iframe.contentWindow.document;
-                if (!doc) return null;
-                const el = doc.getElementById('listsOfBlockedHostsPrompt');
-                return el ? el.innerText.trim() : null;
-            """,
+                self.FILTER_PROMPT_SCRIPT,
+                10,
             )
             if text:
-                match = re.search(r"([\d,]+)\s+network filters", text)
+                match = self.FILTER_COUNT_PATTERN.search(text)
                 if match:
                     return int(match.group(1).replace(",", ""))
         except Exception:
             pass
-        finally:
-            self.browser.set_page_load_timeout(self.settings.page_load_timeout)
         return 0
 
     def wait_for_filters(self) -> bool:
@@ -473,6 +1039,8 @@ class AdNauseamController:
 
         Confirms readiness by checking that the network filter count is non-zero.
         Polls every filter_poll_interval seconds up to filter_poll_timeout seconds.
+        The page is loaded once and read in place, with a full reload only every
+        FILTER_RELOAD_POLLS polls.
 
         Returns:
             True if filters loaded within the timeout, False otherwise.
@@ -480,10 +1048,12 @@ class AdNauseamController:
         if self._filters_ready or not self._uuid:
             return self._filters_ready
         log.info("Waiting for ad detection rules to download...")
-        deadline = time.time() + self.settings.filter_poll_timeout
+        deadline = time.monotonic() + self.settings.filter_poll_timeout
         elapsed = 0
-        while time.time() < deadline:
-            count = self._get_filter_count()
+        polls = 0
+        while time.monotonic() < deadline:
+            count = self._get_filter_count(reload=polls % self.FILTER_RELOAD_POLLS == 0)
+            polls += 1
             if count > 0:
                 log.info(
                     f"Ad detection ready — {count:,} network rules loaded ({elapsed}s)"
@@ -492,7 +1062,8 @@ class AdNauseamController:
                 return True
             elapsed += self.settings.filter_poll_interval
             log.info(f"Still downloading rules... ({elapsed}s elapsed)")
-            time.sleep(self.settings.filter_poll_interval)
+            if self.stop_event.wait(self.settings.filter_poll_interval):
+                return False
         log.warning(
             f"Rule download timed out after {self.settings.filter_poll_timeout}s, proceeding anyway"
         )
@@ -508,6 +1079,10 @@ class AdNauseamController:
             span.total    -> "N ads collected"
             span#detected -> N currently showing
 
+        Waiting for the stats bar to render and reading it happen in a single
+        async script, so the scrape costs one round-trip and returns as soon
+        as the vault is populated instead of after a fixed sleep.
+
         Returns:
             A tuple of (clicked, collected, showing) as human-readable strings.
             Falls back to placeholder strings on failure.
@@ -516,22 +1091,12 @@ class AdNauseamController:
             return "clicked ?", "? ads collected", "?"
         vault_url = f"moz-extension://{self._uuid}/vault.html"
         try:
-            self.browser.set_page_load_timeout(20)
             self.browser.get(vault_url)
-            time.sleep(4)
-            stats: dict[str, str] | None = self.browser.execute_script(
+            self.browser.set_script_timeout(15)
+            stats: dict[str, str] | None = self.browser.execute_async_script(
                 dict,
-                """
-                function getText(selector) {
-                    const el = document.querySelector(selector);
-                    return el ? el.innerText.trim() : null;
-                }
-                return {
-                    clicked:   getText('span.clicked'),
-                    collected: getText('span.total'),
-                    showing:   getText('span#detected')
-                };
-            """,
+                self.VAULT_STATS_SCRIPT,
+                10000,
             )
             if stats is None:
                 return "clicked ?", "? ads collected", "?"
@@ -543,8 +1108,6 @@ class AdNauseamController:
         except Exception as e:
             log.warning(f"Vault scrape failed: {e}")
             return "clicked ?", "? ads collected", "?"
-        finally:
-            self.browser.set_page_load_timeout(self.settings.page_load_timeout)
 
 
 class AdInfinitum:
@@ -555,6 +1118,18 @@ class AdInfinitum:
     and AdNauseamController, and handles scheduled restarts and error recovery.
     """
 
+    SCROLL_SCRIPT: str = """
+    const steps = arguments[0];
+    const done = arguments[arguments.length - 1];
+    (async () => {
+        for (const [px, ms] of steps) {
+            window.scrollBy(0, px);
+            await new Promise(r => setTimeout(r, ms));
+        }
+    })().then(() => done(null), () => done(null));
+    """
+    """Runs a [[pixels, pause_ms], ...] scroll plan inside the page."""
+
     def __init__(self, settings: Settings) -> None:
         """
         Initialise AdInfinitum with the provided settings.
@@ -564,11 +1139,14 @@ class AdInfinitum:
         """
         self.settings = settings
         self.seed_urls: list[str] = self._load_urls()
-        self.browser: BrowserManager = BrowserManager(settings)
+        self.stop_event: threading.Event = threading.Event()
+        self.browser: BrowserManager = BrowserManager(settings, self.stop_event)
         self.controller: AdNauseamController = AdNauseamController(
-            settings, self.browser
+            settings, self.browser, self.stop_event
         )
         self.session_count: int = 0
+        self.rng: random.Random = random.Random(settings.random_seed)
+        self.last_url: str | None = None
 
     def _load_urls(self) -> list[str]:
         """
@@ -615,19 +1193,54 @@ class AdInfinitum:
         log.info("No urls.json found, using default")
         return self.settings.default_urls
 
+    def _next_url(self) -> str:
+        """
+        Pick the next seed URL, avoiding an immediate repeat of the last one.
+
+        Reloading the page just visited rarely turns up new ads, so the
+        previous URL is left out of the draw whenever there is an alternative.
+
+        Returns:
+            The seed URL to visit next.
+        """
+        candidates = [u for u in self.seed_urls if u != self.last_url]
+        self.last_url = self.rng.choice(candidates or self.seed_urls)
+        return self.last_url
+
     def _update_heartbeat(self) -> None:
         """Touch the heartbeat file so the Docker healthcheck knows the process is alive."""
         self.settings.heartbeat_file.touch(exist_ok=True)
 
+    @staticmethod
+    def _dir_size(path: Path) -> int:
+        """
+        Total the size of every file under a directory.
+
+        Uses os.scandir, whose entries carry the file type from the directory
+        listing, so the profile's many small cache files cost one stat each.
+
+        Args:
+            path: Directory to measure.
+
+        Returns:
+            Combined size of all regular files in bytes.
+        """
+        total = 0
+        stack = [str(path)]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        return total
+
     def _log_resources(self) -> None:
         """Log current RAM and Firefox profile disk usage. Silently skips on failure."""
         try:
             mem_bytes = int(Path("/sys/fs/cgroup/memory.current").read_text().strip())
-            profile_size = sum(
-                f.stat().st_size
-                for f in self.settings.profile_dir.rglob("*")
-                if f.is_file()
-            )
+            profile_size = self._dir_size(self.settings.profile_dir)
             log.info(
                 f"RAM: {mem_bytes / 1024**2:.2f}MB | "
                 f"Profile: {profile_size / 1024**2:.2f}MB"
@@ -635,32 +1248,65 @@ class AdInfinitum:
         except Exception:
             pass
 
+    def _over_memory_limit(self) -> bool:
+        """
+        Check whether the browser has grown past the configured RSS limit.
+
+        Returns:
+            True if the browser's process tree exceeds restart_rss_mb.
+        """
+        rss = self.browser.rss_bytes()
+        if rss is None or rss <= self.settings.restart_rss_mb * 1024**2:
+            return False
+        log.info(f"Browser RSS {rss / 1024**2:.0f}MB over limit")
+        return True
+
     def _browse(self, url: str) -> None:
         """
         Visit a URL and simulate natural scrolling behaviour.
 
-        Navigates to the URL, then performs a random number of scroll steps
-        with random distances and pauses, updating the heartbeat throughout.
+        Navigates to the URL, then plans a random number of scroll steps with
+        random distances and pauses. The whole plan is handed to the browser
+        as a single async script, so scrolling costs one WebDriver round-trip
+        per visit rather than one per step. A page load timeout still scrolls
+        whatever has rendered, but a network or certificate error page, which
+        Marionette reports by failing the navigation, is skipped without a
+        restart.
 
         Args:
             url: The URL to visit and scroll through.
         """
-        self.browser.get(url)
-        self._update_heartbeat()
-        steps = random.randint(
-            self.settings.scroll_steps_min,
-            self.settings.scroll_steps_max,
-        )
-        for _ in range(steps):
-            scroll = random.randint(self.settings.scroll_min, self.settings.scroll_max)
-            self.browser.execute_script(str, f"window.scrollBy(0, {scroll});")
-            time.sleep(
-                random.uniform(
-                    self.settings.scroll_pause_min,
-                    self.settings.scroll_pause_max,
-                )
-            )
+        try:
+            self.browser.get(url)
+        except InsecureCertificateException:
+            log.warning(f"Certificate error page for {url}, skipping")
+            return
+        except WebDriverException as e:
+            if "Reached error page" not in (e.msg or ""):
+                raise
+            log.warning(f"Network error page for {url}, skipping")
+            return
+        finally:
             self._update_heartbeat()
+        s = self.settings
+        randint, uniform = self.rng.randint, self.rng.uniform
+        plan = [
+            [
+                randint(s.scroll_min, s.scroll_max),
+                int(uniform(s.scroll_pause_min, s.scroll_pause_max) * 1000),
+            ]
+            for _ in range(randint(s.scroll_steps_min, s.scroll_steps_max))
+        ]
+        self.browser.set_script_timeout(sum(ms for _, ms in plan) / 1000 + 10)
+        try:
+            self.browser.execute_async_script(
+                type(None),
+                self.SCROLL_SCRIPT,
+                plan,
+            )
+        except WebDriverException as e:
+            log.warning(f"Scrolling interrupted: {e.msg}")
+        self._update_heartbeat()
 
     def _setup(self) -> bool:
         """
@@ -679,30 +1325,37 @@ class AdInfinitum:
         return True
 
     def _restart(self) -> None:
-        """Perform a scheduled browser restart and re-run startup checks."""
+        """
+        Perform a scheduled browser restart and re-run startup checks.
+
+        The new browser reuses the same profile, so the controller keeps the
+        UUID and activation it already established and only re-checks filters.
+        """
         log.info("Scheduled restart...")
         self.browser.restart()
-        self.controller.reset()
+        self.controller.reset(keep_profile_state=True)
         self._setup()
 
+    def stop(self) -> None:
+        """Ask the browsing loop and any wait in progress to finish promptly."""
+        self.stop_event.set()
+
     def run(self) -> None:
         """
         Start the main browsing loop.
 
-        Registers signal handlers for clean shutdown, boots the browser,
-        then runs indefinitely — visiting seed URLs, logging vault stats,
-        and restarting the browser on schedule or after errors.
+        Boots the browser, then runs until stop() is called — visiting seed URLs,
+        logging vault stats every vault_scrape_interval sessions, minimising
+        Firefox memory in place between restarts, and restarting the browser
+        on schedule, when its memory grows past restart_rss_mb, or after errors.
         """
-        signal.signal(signal.SIGINT, lambda s, f: sys.exit(0))
-        signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
-
         log.info("AdInfinitum started")
         if not self.browser.start():
             sys.exit(1)
 
-        while True:
+        while not self.stop_event.is_set():
             try:
-                url = random.choice(self.seed_urls)
+                url = self._next_url()
                 self.session_count += 1
                 log.info(f"Session #{self.session_count}: {url}")
                 self._log_resources()
@@ -712,17 +1365,86 @@ class AdInfinitum:
                 if not self.controller.ready:
                     self._setup()
 
-                clicked, collected, showing = self.controller.scrape_vault()
-                log.info(f"Vault: {clicked} | {collected} | {showing} showing")
+                if self.session_count % self.settings.vault_scrape_interval == 0:
+                    clicked, collected, showing = self.controller.scrape_vault()
+                    log.info(f"Vault: {clicked} | {collected} | {showing} showing")
 
-                if self.session_count % self.settings.session_restart_interval == 0:
+                interval = self.settings.session_restart_interval
+                if (
+                    interval and self.session_count % interval == 0
+                ) or self._over_memory_limit():
                     self._restart()
+                elif self.session_count % self.settings.memory_minimize_interval == 0:
+                    self.browser.minimize_memory()
 
             except Exception as e:
+                if self.stop_event.is_set():
+                    break
                 log.error(f"Loop error: {e}")
                 self.browser.restart()
                 self.controller.reset()
 
 
+def main(settings: Settings) -> None:
+    """
+    Run one AdInfinitum worker per configured session slot.
+
+    The workload is almost entirely waiting on page loads and scroll pauses,
+    so each worker runs on its own thread with its own Firefox, profile and
+    geckodriver (Selenium picks a free port for every Service). A single
+    worker runs directly on the main thread. If any worker thread exits, for
+    instance because its browser failed to boot, the whole process exits
+    non-zero so the container restarts instead of running short-handed.
+
+    SIGINT and SIGTERM raise SystemExit on the main thread straight away,
+    even mid-sleep or mid-join. Every worker is then told to stop, which
+    wakes any controller wait in progress, and its browser is quit so no
+    Firefox or geckodriver processes are left behind.
+
+    Args:
+        settings: Validated AdInfinitum settings instance.
+    """
+    signal.signal(signal.SIGINT, lambda s, f: sys.exit(0))
+    signal.signal(signal.SIGTERM, lambda s, f: sys.exit(0))
+
+    workers = [AdInfinitum(settings.for_worker(i)) for i in range(settings.workers)]
+    try:
+        if len(workers) == 1:
+            workers[0].run()
+            return
+
+        BrowserManager(settings)._kill_orphans()
+        exited = threading.Event()
+
+        def run_worker(worker: AdInfinitum) -> None:
+            try:
+                worker.run()
+            finally:
+                if not worker.stop_event.is_set():
+                    log.error("Worker exited")
+                exited.set()
+
+        threads = [
+            threading.Thread(
+                target=run_worker, args=(worker,), name=f"worker-{i}", daemon=True
+            )
+            for i, worker in enumerate(workers)
+        ]
+        log.info(f"Starting {len(threads)} workers")
+        for i, thread in enumerate(threads):
+            if i:
+                time.sleep(settings.worker_start_stagger)
+            thread.start()
+        exited.wait()
+        log.error("A worker exited, shutting down")
+        sys.exit(1)
+    finally:
+        log.info("Shutting down browsers...")
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.browser.stop()
+
+
 if __name__ == "__main__":
-    AdInfinitum(settings=Settings()).run()
+    main(Settings())
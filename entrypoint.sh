@@ -1,15 +1,18 @@
 #!/bin/sh
 set -e
 
-# Clean up any stale Xvfb locks from previous runs
-rm -f /tmp/.X*-lock
+# Native headless Firefox needs no display
+if [ "${HEADLESS:-0}" != "1" ]; then
+    # Clean up any stale Xvfb locks from previous runs
+    rm -f /tmp/.X*-lock
 
-# Start virtual display
-Xvfb :99 -screen 0 1920x1080x24 -ac +extension GLX +render -noreset &
+    # Start virtual display
+    Xvfb :99 -screen 0 1920x1080x24 -ac +extension GLX +render -noreset &
 
-export DISPLAY=:99
+    export DISPLAY=:99
 
-# Give Xvfb a moment to initialize
-sleep 3
+    # Give Xvfb a moment to initialize
+    sleep 3
+fi
 
 exec uv run python -u main.py
\ No newline at end of file
@@ -1,13 +1,25 @@
+import itertools
 import json
 from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    InsecureCertificateException,
+    TimeoutException,
+    WebDriverException,
+)
 
-from adinfinitum.main import AdInfinitum, AdNauseamController, BrowserManager, Settings
+from adinfinitum.main import (
+    AdInfinitum,
+    AdNauseamController,
+    BrowserManager,
+    Settings,
+    main,
+)
 
 
 @pytest.fixture
@@ -69,7 +81,8 @@ class TestSettings:
         assert s.filter_poll_interval == 5
         assert s.filter_poll_timeout == 300
         assert s.page_load_timeout == 45
-        assert s.session_restart_interval == 25
+        assert s.session_restart_interval == 50
+        assert s.memory_minimize_interval == 5
         assert s.default_urls == ["https://www.yahoo.com"]
 
     def test_xpi_path_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -85,6 +98,39 @@ class TestSettings:
         s = ReloadedSettings()
         assert s.xpi_path == Path("/custom/path/adnauseam.xpi")
 
+    def test_profile_template_env_override(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """PROFILE_TEMPLATE env var should set profile_template, unset otherwise."""
+        import importlib
+
+        import adinfinitum.main
+
+        assert adinfinitum.main.Settings().profile_template is None
+        monkeypatch.setenv("PROFILE_TEMPLATE", "/profile-template")
+        importlib.reload(adinfinitum.main)
+        try:
+            assert adinfinitum.main.Settings().profile_template == Path(
+                "/profile-template"
+            )
+        finally:
+            monkeypatch.delenv("PROFILE_TEMPLATE")
+            importlib.reload(adinfinitum.main)
+
+    def test_workers_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """WORKERS env var should override the default worker count."""
+        import importlib
+
+        import adinfinitum.main
+
+        monkeypatch.setenv("WORKERS", "3")
+        importlib.reload(adinfinitum.main)
+        try:
+            assert adinfinitum.main.Settings().workers == 3
+        finally:
+            monkeypatch.delenv("WORKERS")
+            importlib.reload(adinfinitum.main)
+
     def test_field_validation_filter_poll_interval(self) -> None:
         """filter_poll_interval must be >= 1."""
         with pytest.raises(Exception):
@@ -116,6 +162,41 @@ class TestSettings:
         assert s.filter_poll_interval == 10
         assert s.session_restart_interval == 50
 
+    def test_for_worker_single_worker_is_unchanged(self, settings: Settings) -> None:
+        """for_worker should return the same settings when only one worker runs."""
+        assert settings.for_worker(0) is settings
+
+    def test_for_worker_scopes_profile_dir(self, settings: Settings) -> None:
+        """for_worker should give each worker its own profile directory."""
+        settings.workers = 2
+        first = settings.for_worker(0)
+        second = settings.for_worker(1)
+        assert first.profile_dir == settings.profile_dir / "worker-0"
+        assert second.profile_dir == settings.profile_dir / "worker-1"
+        assert first.heartbeat_file == settings.heartbeat_file
+
+    def test_for_worker_offsets_random_seed(self, settings: Settings) -> None:
+        """for_worker should give seeded workers distinct but reproducible seeds."""
+        settings.workers = 2
+        settings.random_seed = 7
+        assert settings.for_worker(0).random_seed == 7
+        assert settings.for_worker(1).random_seed == 8
+
+    def test_geckodriver_port_range_must_fit_workers(self) -> None:
+        """A fixed geckodriver_port must leave room for every worker's offset."""
+        with pytest.raises(ValidationError):
+            Settings(geckodriver_port=65535, workers=2)
+        assert Settings(geckodriver_port=65534, workers=2).geckodriver_port == 65534
+        assert Settings(geckodriver_port=0, workers=8).workers == 8
+
+    def test_for_worker_offsets_geckodriver_port(self, settings: Settings) -> None:
+        """for_worker should give each worker its own fixed geckodriver port."""
+        settings.workers = 2
+        assert settings.for_worker(1).geckodriver_port == 0
+        settings.geckodriver_port = 4444
+        assert settings.for_worker(0).geckodriver_port == 4444
+        assert settings.for_worker(1).geckodriver_port == 4445
+
 
 class TestBrowserManager:
     """Tests for BrowserManager — options, script execution, navigation."""
@@ -131,6 +212,228 @@ class TestBrowserManager:
         assert "--width=1920" in opts.arguments
         assert "--height=1080" in opts.arguments
 
+    def test_start_installs_addon_on_fresh_profile(
+        self, browser: BrowserManager, mocker: MockerFixture
+    ) -> None:
+        """start() should install AdNauseam permanently when the profile lacks it."""
+        mocker.patch.object(browser, "_kill_orphans")
+        mocker.patch("adinfinitum.main.Service")
+        firefox_mock = mocker.patch("adinfinitum.main.webdriver.Firefox")
+        assert browser.start() is True
+        firefox_mock.return_value.install_addon.assert_called_once_with(
+            str(browser.settings.xpi_path)
+        )
+
+    def test_start_skips_install_when_profile_has_addon(
+        self, browser: BrowserManager, mocker: MockerFixture
+    ) -> None:
+        """start() should not reinstall AdNauseam into a profile that already has it."""
+        extensions = browser.settings.profile_dir / "extensions"
+        extensions.mkdir(parents=True)
+        (extensions / f"{AdNauseamController.EXTENSION_ID}.xpi").touch()
+        mocker.patch.object(browser, "_kill_orphans")
+        mocker.patch("adinfinitum.main.Service")
+        firefox_mock = mocker.patch("adinfinitum.main.webdriver.Firefox")
+        assert browser.start() is True
+        firefox_mock.return_value.install_addon.assert_not_called()
+
+    def test_start_returns_false_on_boot_failure(
+        self, browser: BrowserManager, mocker: MockerFixture
+    ) -> None:
+        """start() should return False and clear the driver when Firefox fails to boot."""
+        mocker.patch.object(browser, "_kill_orphans")
+        mocker.patch("adinfinitum.main.Service")
+        mocker.patch(
+            "adinfinitum.main.webdriver.Firefox", side_effect=Exception("no firefox")
+        )
+        assert browser.start() is False
+        assert browser.driver is None
+
+    def test_seed_profile_copies_template(
+        self, settings: Settings, tmp_path: Path
+    ) -> None:
+        """_seed_profile should copy the template into an empty profile, minus locks."""
+        template = tmp_path / "template"
+        (template / "extensions").mkdir(parents=True)
+        (template / "extensions" / "adnauseam@rednoise.org.xpi").write_text("xpi")
+        (template / "lock").write_text("")
+        browser = BrowserManager(
+            settings.model_copy(update={"profile_template": template})
+        )
+        browser.settings.profile_dir.mkdir(parents=True)
+        browser._seed_profile()
+        assert browser._addon_installed()
+        assert not (browser.settings.profile_dir / "lock").exists()
+
+    def test_seed_profile_leaves_existing_profile(
+        self, settings: Settings, tmp_path: Path
+    ) -> None:
+        """_seed_profile should not touch a profile that already has content."""
+        template = tmp_path / "template"
+        template.mkdir()
+        (template / "prefs.js").write_text("template")
+        browser = BrowserManager(
+            settings.model_copy(update={"profile_template": template})
+        )
+        browser.settings.profile_dir.mkdir(parents=True)
+        (browser.settings.profile_dir / "prefs.js").write_text("existing")
+        browser._seed_profile()
+        assert (browser.settings.profile_dir / "prefs.js").read_text() == "existing"
+
+    def test_start_refuses_to_boot_once_stopped(
+        self, browser: BrowserManager, mocker: MockerFixture
+    ) -> None:
+        """start() should not boot Firefox after the stop event is set."""
+        firefox_mock = mocker.patch("adinfinitum.main.webdriver.Firefox")
+        browser.stop_event.set()
+        assert browser.start() is False
+        firefox_mock.assert_not_called()
+
+    def test_start_quits_browser_booted_during_shutdown(
+        self, browser: BrowserManager, mocker: MockerFixture
+    ) -> None:
+        """start() should quit a browser whose boot finished after shutdown began."""
+        mocker.patch.object(browser, "_kill_orphans")
+        mocker.patch.object(browser, "_process_tree", return_value=[])
+        mocker.patch("adinfinitum.main.Service")
+        driver = MagicMock()
+
+        def boot(**kwargs: object) -> MagicMock:
+            browser.stop_event.set()
+            return driver
+
+        mocker.patch("adinfinitum.main.webdriver.Firefox", side_effect=boot)
+        assert browser.start() is False
+        driver.quit.assert_called_once()
+        assert browser.driver is None
+
+    def test_start_returns_false_on_missing_template(
+        self, settings: Settings, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """start() should report a boot failure when profile_template is missing."""
+        browser = BrowserManager(
+            settings.model_copy(update={"profile_template": tmp_path / "missing"})
+        )
+        mocker.patch.object(browser, "_kill_orphans")
+        firefox_mock = mocker.patch("adinfinitum.main.webdriver.Firefox")
+        assert browser.start() is False
+        firefox_mock.assert_not_called()
+        assert browser.driver is None
+
+    def test_write_user_prefs_creates_user_js(self, browser: BrowserManager) -> None:
+        """_write_user_prefs should write every preference as a user_pref line."""
+        browser.settings.profile_dir.mkdir(parents=True)
+        browser._write_user_prefs()
+        content = (browser.settings.profile_dir / "user.js").read_text()
+        assert 'user_pref("extensions.autoDisableScopes", 0);' in content
+        assert 'user_pref("xpinstall.signatures.required", false);' in content
+        assert 'user_pref("browser.cache.disk.capacity", 524288);' in content
+        assert 'user_pref("browser.sessionhistory.max_total_viewers", 0);' in content
+        assert 'user_pref("browser.sessionhistory.max_entries", 5);' in content
+        assert content.count("user_pref(") == len(BrowserManager.PREFERENCES) + 1
+        assert "permissions.default.image" not in content
+
+    def test_write_user_prefs_adds_media_blocking(self, settings: Settings) -> None:
+        """_write_user_prefs should add the media-blocking prefs when block_media is set."""
+        browser = BrowserManager(settings.model_copy(update={"block_media": True}))
+        browser.settings.profile_dir.mkdir(parents=True)
+        browser._write_user_prefs()
+        content = (browser.settings.profile_dir / "user.js").read_text()
+        assert 'user_pref("permissions.default.image", 2);' in content
+        assert 'user_pref("browser.cache.disk.enable", false);' in content
+
+    def test_write_user_prefs_skips_unchanged_file(
+        self, browser: BrowserManager
+    ) -> None:
+        """_write_user_prefs should not rewrite a user.js that is already current."""
+        browser.settings.profile_dir.mkdir(parents=True)
+        browser._write_user_prefs()
+        user_js = browser.settings.profile_dir / "user.js"
+        mtime = user_js.stat().st_mtime_ns
+        browser._write_user_prefs()
+        assert user_js.stat().st_mtime_ns == mtime
+
+    def test_build_options_uses_eager_page_load(self, browser: BrowserManager) -> None:
+        """Firefox options should return from navigation once the DOM is ready."""
+        opts = browser._build_options()
+        assert opts.page_load_strategy == "eager"
+        assert opts.timeouts == {"pageLoad": browser.settings.page_load_timeout * 1000}
+        assert "-headless" not in opts.arguments
+
+    def test_build_options_adds_headless_flag(self, settings: Settings) -> None:
+        """Firefox options should request native headless mode when enabled."""
+        browser = BrowserManager(settings.model_copy(update={"headless": True}))
+        assert "-headless" in browser._build_options().arguments
+
+    def test_minimize_memory_without_driver(self, browser: BrowserManager) -> None:
+        """minimize_memory() should return False when no driver is attached."""
+        assert browser.minimize_memory() is False
+
+    def test_minimize_memory_runs_in_chrome_context(
+        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
+    ) -> None:
+        """minimize_memory() should run the minimisation script in the chrome context."""
+        assert browser_with_driver.minimize_memory() is True
+        mock_driver.context.assert_called_once_with(mock_driver.CONTEXT_CHROME)
+        mock_driver.execute_async_script.assert_called_once()
+
+    def test_minimize_memory_handles_webdriver_error(
+        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
+    ) -> None:
+        """minimize_memory() should return False when the chrome context is refused."""
+        mock_driver.execute_async_script.side_effect = WebDriverException("denied")
+        assert browser_with_driver.minimize_memory() is False
+
+    def test_process_tree_rss_sums_descendants(self, tmp_path: Path) -> None:
+        """_process_tree_rss should total RSS for a process and its descendants only."""
+
+        def write_stat(pid: int, ppid: int, rss_pages: int) -> None:
+            (tmp_path / str(pid)).mkdir()
+            rest = " ".join(["0"] * 19)
+            (tmp_path / str(pid) / "stat").write_text(
+                f"{pid} (fire fox) S {ppid} {rest} {rss_pages} 0\n"
+            )
+
+        write_stat(10, 1, 1)  # geckodriver
+        write_stat(11, 10, 2)  # firefox
+        write_stat(12, 11, 4)  # content process
+        write_stat(20, 1, 100)  # unrelated
+        page = __import__("os").sysconf("SC_PAGE_SIZE")
+        assert BrowserManager._process_tree_rss(10, tmp_path) == 7 * page
+
+    def test_stop_kills_processes_left_after_quit(
+        self,
+        browser_with_driver: BrowserManager,
+        mock_driver: MagicMock,
+        mocker: MockerFixture,
+    ) -> None:
+        """stop() should SIGKILL the recorded process tree after quitting the driver."""
+        mocker.patch.object(
+            BrowserManager, "_process_tree", return_value={10: 1, 11: 2}
+        )
+        kill_mock = mocker.patch(
+            "adinfinitum.main.os.kill", side_effect=[None, OSError]
+        )
+        browser_with_driver.stop()
+        mock_driver.quit.assert_called_once()
+        assert [c.args[0] for c in kill_mock.call_args_list] == [10, 11]
+        assert browser_with_driver.driver is None
+
+    def test_start_clears_orphans_only_once(
+        self, browser: BrowserManager, mocker: MockerFixture
+    ) -> None:
+        """start() should only pkill leftovers on the first boot, not on restarts."""
+        kill_mock = mocker.patch.object(browser, "_kill_orphans")
+        mocker.patch("adinfinitum.main.Service")
+        mocker.patch("adinfinitum.main.webdriver.Firefox")
+        browser.start()
+        browser.start()
+        kill_mock.assert_called_once()
+
+    def test_rss_bytes_without_driver(self, browser: BrowserManager) -> None:
+        """rss_bytes() should return None when no driver is attached."""
+        assert browser.rss_bytes() is None
+
     def test_execute_script_returns_none_without_driver(
         self, browser: BrowserManager
     ) -> None:
@@ -162,6 +465,50 @@ class TestBrowserManager:
         result = browser_with_driver.execute_script(dict, "return {key: 'value'};")
         assert result == {"key": "value"}
 
+    def test_execute_async_script_returns_none_without_driver(
+        self, browser: BrowserManager
+    ) -> None:
+        """execute_async_script should return None when no driver is attached."""
+        result = browser.execute_async_script(int, "arguments[0](1);")
+        assert result is None
+
+    def test_execute_async_script_returns_typed_result(
+        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
+    ) -> None:
+        """execute_async_script should forward args and return a matching result."""
+        mock_driver.execute_async_script.return_value = 3
+        result = browser_with_driver.execute_async_script(int, "script", [1, 2])
+        assert result == 3
+        mock_driver.execute_async_script.assert_called_once_with("script", [1, 2])
+
+    def test_wait_for_script_returns_first_truthy_result(
+        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
+    ) -> None:
+        """wait_for_script should keep polling until the probe returns a value."""
+        mock_driver.execute_script.side_effect = [None, "", "ready"]
+        result = browser_with_driver.wait_for_script(str, "return x;", 5)
+        assert result == "ready"
+        assert mock_driver.execute_script.call_count == 3
+
+    def test_wait_for_script_returns_none_on_timeout(
+        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
+    ) -> None:
+        """wait_for_script should return None when the probe never succeeds."""
+        mock_driver.execute_script.return_value = None
+        result = browser_with_driver.wait_for_script(str, "return x;", 0.3)
+        assert result is None
+
+    def test_wait_for_script_without_driver(self, browser: BrowserManager) -> None:
+        """wait_for_script should return None when no driver is attached."""
+        assert browser.wait_for_script(str, "return x;", 1) is None
+
+    def test_set_script_timeout_with_driver(
+        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
+    ) -> None:
+        """set_script_timeout() should delegate to the driver."""
+        browser_with_driver.set_script_timeout(12.5)
+        mock_driver.set_script_timeout.assert_called_once_with(12.5)
+
     def test_get_returns_true_on_success(
         self, browser_with_driver: BrowserManager, mock_driver: MagicMock
     ) -> None:
@@ -169,6 +516,7 @@ class TestBrowserManager:
         result = browser_with_driver.get("https://example.com")
         assert result is True
         mock_driver.get.assert_called_once_with("https://example.com")
+        mock_driver.set_page_load_timeout.assert_not_called()
 
     def test_get_returns_false_on_timeout(
         self, browser_with_driver: BrowserManager, mock_driver: MagicMock
@@ -203,19 +551,6 @@ class TestBrowserManager:
         """stop() should be a no-op when no driver is attached."""
         browser.stop()  # Should not raise
 
-    def test_set_page_load_timeout_without_driver_is_safe(
-        self, browser: BrowserManager
-    ) -> None:
-        """set_page_load_timeout() should be a no-op when no driver is attached."""
-        browser.set_page_load_timeout(30)  # Should not raise
-
-    def test_set_page_load_timeout_with_driver(
-        self, browser_with_driver: BrowserManager, mock_driver: MagicMock
-    ) -> None:
-        """set_page_load_timeout() should delegate to the driver."""
-        browser_with_driver.set_page_load_timeout(30)
-        mock_driver.set_page_load_timeout.assert_called_once_with(30)
-
 
 class TestAdNauseamControllerReset:
     """Tests for reset() and the ready property."""
@@ -245,6 +580,17 @@ class TestAdNauseamControllerReset:
         assert controller_with_uuid._filters_ready is False
         assert controller_with_uuid.ready is False
 
+    def test_reset_keeping_profile_state(
+        self, controller_with_uuid: AdNauseamController
+    ) -> None:
+        """reset(keep_profile_state=True) should only clear filter readiness."""
+        controller_with_uuid._activated = True
+        controller_with_uuid._filters_ready = True
+        controller_with_uuid.reset(keep_profile_state=True)
+        assert controller_with_uuid._uuid == "test-uuid-1234"
+        assert controller_with_uuid._activated is True
+        assert controller_with_uuid._filters_ready is False
+
 
 class TestAdNauseamControllerUUID:
     """Tests for UUID discovery via prefs.js and about:debugging."""
@@ -296,6 +642,14 @@ class TestAdNauseamControllerUUID:
         result = controller._uuid_from_prefs()
         assert result is None
 
+    def test_uuid_from_debugger_polls_for_label(
+        self, controller: AdNauseamController, mock_driver: MagicMock
+    ) -> None:
+        """_uuid_from_debugger should return the UUID once the debugging UI renders it."""
+        mock_driver.execute_script.side_effect = [None, "dbg-uuid"]
+        assert controller._uuid_from_debugger() == "dbg-uuid"
+        mock_driver.get.assert_called_once_with("about:debugging#/runtime/this-firefox")
+
     def test_discover_uuid_uses_prefs_first(
         self, controller: AdNauseamController, mocker: MockerFixture
     ) -> None:
@@ -311,7 +665,9 @@ class TestAdNauseamControllerUUID:
         self, controller: AdNauseamController, mocker: MockerFixture
     ) -> None:
         """discover_uuid should fall back to about:debugging when prefs.js fails."""
+        mocker.patch.object(controller, "_uuid_from_chrome", return_value=None)
         mocker.patch.object(controller, "_uuid_from_prefs", return_value=None)
+        mocker.patch.object(controller.stop_event, "wait", return_value=False)
         mocker.patch.object(
             controller, "_uuid_from_debugger", return_value="debug-uuid"
         )
@@ -319,16 +675,106 @@ class TestAdNauseamControllerUUID:
         assert result is True
         assert controller._uuid == "debug-uuid"
 
+    def test_discover_uuid_uses_chrome_before_debugger(
+        self, controller: AdNauseamController, mocker: MockerFixture
+    ) -> None:
+        """discover_uuid should ask the chrome context before retrying or scraping."""
+        mocker.patch.object(controller, "_uuid_from_prefs", return_value=None)
+        mocker.patch.object(controller, "_uuid_from_chrome", return_value="chrome-uuid")
+        wait_mock = mocker.patch.object(controller.stop_event, "wait")
+        debugger_mock = mocker.patch.object(controller, "_uuid_from_debugger")
+        assert controller.discover_uuid() is True
+        assert controller._uuid == "chrome-uuid"
+        wait_mock.assert_not_called()
+        debugger_mock.assert_not_called()
+
+    def test_uuid_from_chrome_reads_extension_policy(
+        self, controller: AdNauseamController, mock_driver: MagicMock
+    ) -> None:
+        """_uuid_from_chrome should run the policy lookup in the chrome context."""
+        mock_driver.execute_script.return_value = "chrome-uuid"
+        assert controller._uuid_from_chrome() == "chrome-uuid"
+        mock_driver.context.assert_called_once_with(mock_driver.CONTEXT_CHROME)
+        mock_driver.execute_script.assert_called_once_with(
+            AdNauseamController.CHROME_UUID_SCRIPT, AdNauseamController.EXTENSION_ID
+        )
+
+    def test_uuid_from_chrome_returns_none_on_error(
+        self, controller: AdNauseamController, mock_driver: MagicMock
+    ) -> None:
+        """_uuid_from_chrome should return None when the chrome context is refused."""
+        mock_driver.context.side_effect = WebDriverException("denied")
+        assert controller._uuid_from_chrome() is None
+
+    def test_discover_uuid_retries_prefs_before_debugger(
+        self, controller: AdNauseamController, mocker: MockerFixture
+    ) -> None:
+        """discover_uuid should re-read prefs.js while Firefox has yet to write it."""
+        mocker.patch.object(controller, "_uuid_from_chrome", return_value=None)
+        prefs_mock = mocker.patch.object(
+            controller, "_uuid_from_prefs", side_effect=[None, None, "prefs-uuid"]
+        )
+        wait_mock = mocker.patch.object(
+            controller.stop_event, "wait", return_value=False
+        )
+        debugger_mock = mocker.patch.object(controller, "_uuid_from_debugger")
+        assert controller.discover_uuid() is True
+        assert controller._uuid == "prefs-uuid"
+        assert prefs_mock.call_count == 3
+        assert wait_mock.call_count == 2
+        debugger_mock.assert_not_called()
+
     def test_discover_uuid_returns_false_when_both_fail(
         self, controller: AdNauseamController, mocker: MockerFixture
     ) -> None:
-        """discover_uuid should return False when both methods fail."""
+        """discover_uuid should return False when every method fails."""
+        mocker.patch.object(controller, "_uuid_from_chrome", return_value=None)
         mocker.patch.object(controller, "_uuid_from_prefs", return_value=None)
+        mocker.patch.object(controller.stop_event, "wait", return_value=False)
         mocker.patch.object(controller, "_uuid_from_debugger", return_value=None)
         result = controller.discover_uuid()
         assert result is False
         assert controller._uuid is None
 
+    def test_discover_uuid_uses_profile_cache(
+        self, controller: AdNauseamController, mocker: MockerFixture
+    ) -> None:
+        """discover_uuid should take a valid cached UUID without any lookup."""
+        uuid = "0123abcd-0000-4000-8000-0123456789ab"
+        controller.settings.profile_dir.mkdir(parents=True)
+        (controller.settings.profile_dir / controller.UUID_CACHE_FILE).write_text(uuid)
+        prefs_mock = mocker.patch.object(controller, "_uuid_from_prefs")
+        assert controller.discover_uuid() is True
+        assert controller._uuid == uuid
+        prefs_mock.assert_not_called()
+
+    def test_discover_uuid_ignores_malformed_cache_and_saves_new(
+        self, controller: AdNauseamController, mocker: MockerFixture
+    ) -> None:
+        """discover_uuid should replace a malformed cache with the located UUID."""
+        uuid = "0123abcd-0000-4000-8000-0123456789ab"
+        cache = controller.settings.profile_dir / controller.UUID_CACHE_FILE
+        controller.settings.profile_dir.mkdir(parents=True)
+        cache.write_text("not-a-uuid")
+        mocker.patch.object(controller, "_uuid_from_prefs", return_value=uuid)
+        assert controller.discover_uuid() is True
+        assert cache.read_text() == uuid
+
+    def test_full_reset_drops_uuid_cache(
+        self, controller_with_uuid: AdNauseamController
+    ) -> None:
+        """reset() without keep_profile_state should delete the cached UUID."""
+        cache = (
+            controller_with_uuid.settings.profile_dir
+            / controller_with_uuid.UUID_CACHE_FILE
+        )
+        cache.parent.mkdir(parents=True)
+        cache.write_text("0123abcd-0000-4000-8000-0123456789ab")
+        controller_with_uuid.reset(keep_profile_state=True)
+        assert cache.exists()
+        controller_with_uuid.reset()
+        assert not cache.exists()
+
     def test_discover_uuid_skips_if_already_set(
         self, controller_with_uuid: AdNauseamController, mocker: MockerFixture
     ) -> None:
@@ -362,11 +808,14 @@ class TestAdNauseamControllerActivation:
         mock_driver: MagicMock,
     ) -> None:
         """activate() should set _activated=True when all settings are already on."""
-        mock_driver.execute_script.return_value = {
-            "hidingAds": "already on",
-            "clickingAds": "already on",
-            "blockingMalware": "already on",
-        }
+        mock_driver.execute_script.side_effect = [
+            True,
+            {
+                "hidingAds": "already on",
+                "clickingAds": "already on",
+                "blockingMalware": "already on",
+            },
+        ]
         result = controller_with_uuid.activate()
         assert result is True
         assert controller_with_uuid._activated is True
@@ -377,11 +826,14 @@ class TestAdNauseamControllerActivation:
         mock_driver: MagicMock,
     ) -> None:
         """activate() should set _activated=True when settings are toggled on."""
-        mock_driver.execute_script.return_value = {
-            "hidingAds": "activated",
-            "clickingAds": "activated",
-            "blockingMalware": "activated",
-        }
+        mock_driver.execute_script.side_effect = [
+            True,
+            {
+                "hidingAds": "activated",
+                "clickingAds": "activated",
+                "blockingMalware": "activated",
+            },
+        ]
         result = controller_with_uuid.activate()
         assert result is True
         assert controller_with_uuid._activated is True
@@ -392,11 +844,47 @@ class TestAdNauseamControllerActivation:
         mock_driver: MagicMock,
     ) -> None:
         """activate() should not set _activated when the iframe is missing."""
-        mock_driver.execute_script.return_value = {"error": "no iframe found"}
+        mock_driver.execute_script.side_effect = [True, {"error": "no iframe found"}]
         result = controller_with_uuid.activate()
         assert result is False
         assert controller_with_uuid._activated is False
 
+    def test_activate_fails_when_toggle_missing(
+        self,
+        controller_with_uuid: AdNauseamController,
+        mock_driver: MagicMock,
+        mocker: MockerFixture,
+    ) -> None:
+        """activate() should not set _activated when any toggle is not found."""
+        mocker.patch.object(controller_with_uuid.stop_event, "wait")
+        mock_driver.execute_script.side_effect = [
+            True,
+            {
+                "hidingAds": "not found",
+                "clickingAds": "already on",
+                "blockingMalware": "already on",
+            },
+        ]
+        result = controller_with_uuid.activate()
+        assert result is False
+        assert controller_with_uuid._activated is False
+
+    def test_activate_fails_when_options_never_render(
+        self,
+        controller_with_uuid: AdNauseamController,
+        mocker: MockerFixture,
+    ) -> None:
+        """activate() should give up without toggling when the readiness probe times out."""
+        mocker.patch.object(
+            controller_with_uuid.browser, "wait_for_script", return_value=None
+        )
+        script_mock = mocker.patch.object(
+            controller_with_uuid.browser, "execute_script"
+        )
+        assert controller_with_uuid.activate() is False
+        assert controller_with_uuid._activated is False
+        script_mock.assert_not_called()
+
     def test_activate_handles_exception(
         self,
         controller_with_uuid: AdNauseamController,
@@ -407,6 +895,24 @@ class TestAdNauseamControllerActivation:
         result = controller_with_uuid.activate()
         assert result is False
 
+    def test_activate_waits_for_options_toggles(
+        self,
+        controller_with_uuid: AdNauseamController,
+        mocker: MockerFixture,
+    ) -> None:
+        """activate() should poll for the options toggles rather than sleep blindly."""
+        wait_mock = mocker.patch.object(
+            controller_with_uuid.browser, "wait_for_script", return_value=True
+        )
+        mocker.patch.object(controller_with_uuid.stop_event, "wait")
+        mocker.patch.object(
+            controller_with_uuid.browser,
+            "execute_script",
+            return_value={"hidingAds": "already on"},
+        )
+        assert controller_with_uuid.activate() is True
+        assert wait_mock.call_args[0][1] == AdNauseamController.OPTIONS_READY_SCRIPT
+
 
 class TestAdNauseamControllerFilters:
     """Tests for filter list polling via _get_filter_count() and wait_for_filters()."""
@@ -426,10 +932,12 @@ class TestAdNauseamControllerFilters:
     def test_get_filter_count_returns_zero_on_none(
         self,
         controller_with_uuid: AdNauseamController,
-        mock_driver: MagicMock,
+        mocker: MockerFixture,
     ) -> None:
-        """_get_filter_count should return 0 when the element text is None."""
-        mock_driver.execute_script.return_value = None
+        """_get_filter_count should return 0 when the prompt never renders."""
+        mocker.patch.object(
+            controller_with_uuid.browser, "wait_for_script", return_value=None
+        )
         count = controller_with_uuid._get_filter_count()
         assert count == 0
 
@@ -467,7 +975,7 @@ class TestAdNauseamControllerFilters:
             "_get_filter_count",
             side_effect=[0, 0, 155000],
         )
-        mocker.patch("adinfinitum.main.time.sleep")
+        mocker.patch.object(controller_with_uuid.stop_event, "wait", return_value=False)
         result = controller_with_uuid.wait_for_filters()
         assert result is True
 
@@ -478,21 +986,63 @@ class TestAdNauseamControllerFilters:
     ) -> None:
         """wait_for_filters should return False after the timeout is exceeded."""
         mocker.patch.object(controller_with_uuid, "_get_filter_count", return_value=0)
-        mocker.patch("adinfinitum.main.time.sleep")
-        # Force immediate timeout by making time.time() advance past deadline
+        mocker.patch.object(controller_with_uuid.stop_event, "wait", return_value=False)
+        # Force immediate timeout by making time.monotonic() advance past deadline
         call_count = 0
-        original_time: Callable[[], float] = __import__("time").time
+        original_time: Callable[[], float] = __import__("time").monotonic
 
         def fast_time() -> float:
             nonlocal call_count
             call_count += 1
             return original_time() + (call_count * 100)
 
-        mocker.patch("adinfinitum.main.time.time", side_effect=fast_time)
+        mocker.patch("adinfinitum.main.time.monotonic", side_effect=fast_time)
         result = controller_with_uuid.wait_for_filters()
         assert result is False
         assert controller_with_uuid._filters_ready is False
 
+    def test_wait_for_filters_reloads_page_periodically(
+        self,
+        controller_with_uuid: AdNauseamController,
+        mocker: MockerFixture,
+    ) -> None:
+        """wait_for_filters should reload the page only every FILTER_RELOAD_POLLS polls."""
+        polls = AdNauseamController.FILTER_RELOAD_POLLS + 1
+        count_mock = mocker.patch.object(
+            controller_with_uuid,
+            "_get_filter_count",
+            side_effect=[0] * (polls - 1) + [155000],
+        )
+        mocker.patch.object(controller_with_uuid.stop_event, "wait", return_value=False)
+        assert controller_with_uuid.wait_for_filters() is True
+        reloads = [c.kwargs["reload"] for c in count_mock.call_args_list]
+        assert reloads == [True] + [False] * (polls - 2) + [True]
+
+    def test_get_filter_count_reads_in_place_without_reload(
+        self,
+        controller_with_uuid: AdNauseamController,
+        mock_driver: MagicMock,
+    ) -> None:
+        """_get_filter_count(reload=False) should not navigate."""
+        mock_driver.execute_script.return_value = "5 network filters"
+        assert controller_with_uuid._get_filter_count(reload=False) == 5
+        mock_driver.get.assert_not_called()
+        mock_driver.set_page_load_timeout.assert_not_called()
+
+    def test_wait_for_filters_stops_on_shutdown(
+        self,
+        controller_with_uuid: AdNauseamController,
+        mocker: MockerFixture,
+    ) -> None:
+        """wait_for_filters should give up as soon as a shutdown is requested."""
+        count_mock = mocker.patch.object(
+            controller_with_uuid, "_get_filter_count", return_value=0
+        )
+        controller_with_uuid.stop_event.set()
+        result = controller_with_uuid.wait_for_filters()
+        assert result is False
+        count_mock.assert_called_once()
+
     def test_wait_for_filters_skips_if_already_ready(
         self,
         controller_with_uuid: AdNauseamController,
@@ -533,7 +1083,7 @@ class TestAdNauseamControllerVault:
         mock_driver: MagicMock,
     ) -> None:
         """scrape_vault should return parsed stats from the vault DOM."""
-        mock_driver.execute_script.return_value = {
+        mock_driver.execute_async_script.return_value = {
             "clicked": "clicked 42",
             "collected": "99 ads collected",
             "showing": "50",
@@ -548,8 +1098,8 @@ class TestAdNauseamControllerVault:
         controller_with_uuid: AdNauseamController,
         mock_driver: MagicMock,
     ) -> None:
-        """scrape_vault should return placeholders when execute_script returns None."""
-        mock_driver.execute_script.return_value = None
+        """scrape_vault should return placeholders when the script returns None."""
+        mock_driver.execute_async_script.return_value = None
         clicked, collected, showing = controller_with_uuid.scrape_vault()
         assert clicked == "clicked ?"
         assert collected == "? ads collected"
@@ -561,7 +1111,7 @@ class TestAdNauseamControllerVault:
         mock_driver: MagicMock,
     ) -> None:
         """scrape_vault should return placeholders when an exception is raised."""
-        mock_driver.execute_script.side_effect = Exception("vault error")
+        mock_driver.execute_async_script.side_effect = Exception("vault error")
         clicked, collected, showing = controller_with_uuid.scrape_vault()
         assert clicked == "clicked ?"
         assert collected == "? ads collected"
@@ -573,7 +1123,7 @@ class TestAdNauseamControllerVault:
         mock_driver: MagicMock,
     ) -> None:
         """scrape_vault should use placeholder strings for any missing stat keys."""
-        mock_driver.execute_script.return_value = {
+        mock_driver.execute_async_script.return_value = {
             "clicked": "clicked 5",
             "collected": None,
             "showing": None,
@@ -643,6 +1193,22 @@ class TestAdInfiniumURLLoading:
         assert ai.seed_urls == settings.default_urls
 
 
+class TestAdInfiniumNextUrl:
+    """Tests for _next_url() — seed URL selection."""
+
+    def test_never_repeats_previous_url(self, settings: Settings) -> None:
+        """_next_url should not pick the same URL twice in a row."""
+        settings.urls_path.write_text(json.dumps(["https://a.com", "https://b.com"]))
+        ai = AdInfinitum(settings)
+        picks = [ai._next_url() for _ in range(20)]
+        assert all(a != b for a, b in itertools.pairwise(picks))
+
+    def test_repeats_single_seed(self, settings: Settings) -> None:
+        """_next_url should keep returning the only seed when there is no alternative."""
+        ai = AdInfinitum(settings)
+        assert ai._next_url() == ai._next_url() == settings.default_urls[0]
+
+
 class TestAdInfiniumHeartbeat:
     """Tests for _update_heartbeat()."""
 
@@ -680,43 +1246,173 @@ class TestAdInfiniumResources:
         ai = AdInfinitum(settings)
         ai._log_resources()  # Should not raise
 
+    def test_dir_size_sums_nested_files(self, tmp_path: Path) -> None:
+        """_dir_size should total file sizes across nested directories."""
+        (tmp_path / "cache2" / "entries").mkdir(parents=True)
+        (tmp_path / "prefs.js").write_bytes(b"x" * 10)
+        (tmp_path / "cache2" / "entries" / "a").write_bytes(b"x" * 32)
+        assert AdInfinitum._dir_size(tmp_path) == 42
+
     def test_log_resources_silently_skips_on_error(self, settings: Settings) -> None:
         """_log_resources should not raise when cgroup file is absent."""
         ai = AdInfinitum(settings)
         ai._log_resources()  # Should not raise
 
 
+class TestAdInfiniumMemoryLimit:
+    """Tests for _over_memory_limit()."""
+
+    def test_under_limit(self, settings: Settings, mocker: MockerFixture) -> None:
+        """_over_memory_limit should be False while RSS is below the limit."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "rss_bytes", return_value=100 * 1024**2)
+        assert ai._over_memory_limit() is False
+
+    def test_over_limit(self, settings: Settings, mocker: MockerFixture) -> None:
+        """_over_memory_limit should be True once RSS exceeds the limit."""
+        ai = AdInfinitum(settings)
+        rss = (settings.restart_rss_mb + 1) * 1024**2
+        mocker.patch.object(ai.browser, "rss_bytes", return_value=rss)
+        assert ai._over_memory_limit() is True
+
+    def test_without_browser(self, settings: Settings) -> None:
+        """_over_memory_limit should be False when no browser is running."""
+        ai = AdInfinitum(settings)
+        assert ai._over_memory_limit() is False
+
+
 class TestAdInfiniumBrowse:
     """Tests for _browse() — navigation and scroll simulation."""
 
     def test_browse_calls_get_and_scrolls(
         self, settings: Settings, mocker: MockerFixture
     ) -> None:
-        """_browse should navigate to the URL and execute scroll scripts."""
+        """_browse should navigate to the URL and run the scroll plan in one script."""
         ai = AdInfinitum(settings)
         get_mock = mocker.patch.object(ai.browser, "get", return_value=True)
-        script_mock = mocker.patch.object(ai.browser, "execute_script")
-        mocker.patch("adinfinitum.main.time.sleep")
+        script_mock = mocker.patch.object(ai.browser, "execute_async_script")
         settings.heartbeat_file.parent.mkdir(parents=True, exist_ok=True)
 
         ai._browse("https://example.com")
 
         get_mock.assert_called_once_with("https://example.com")
-        assert script_mock.call_count >= settings.scroll_steps_min
+        script_mock.assert_called_once()
+        plan = script_mock.call_args.args[2]
+        assert settings.scroll_steps_min <= len(plan) <= settings.scroll_steps_max
+        for px, ms in plan:
+            assert settings.scroll_min <= px <= settings.scroll_max
+            assert (
+                settings.scroll_pause_min * 1000
+                <= ms
+                <= settings.scroll_pause_max * 1000
+            )
+
+    def test_browse_plan_is_reproducible_with_seed(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """_browse should produce the same scroll plan for the same random_seed."""
+        settings.random_seed = 42
+        plans = []
+        for _ in range(2):
+            ai = AdInfinitum(settings)
+            mocker.patch.object(ai.browser, "get", return_value=True)
+            script_mock = mocker.patch.object(ai.browser, "execute_async_script")
+            mocker.patch.object(ai, "_update_heartbeat")
+            ai._browse("https://example.com")
+            plans.append(script_mock.call_args.args[2])
+        assert plans[0] == plans[1]
+
+    def test_browse_sets_script_timeout_to_cover_plan(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """_browse should allow the scroll script enough time to finish its pauses."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "get", return_value=True)
+        script_mock = mocker.patch.object(ai.browser, "execute_async_script")
+        timeout_mock = mocker.patch.object(ai.browser, "set_script_timeout")
+        settings.heartbeat_file.parent.mkdir(parents=True, exist_ok=True)
+
+        ai._browse("https://example.com")
+
+        plan = script_mock.call_args.args[2]
+        (timeout,) = timeout_mock.call_args.args
+        assert timeout > sum(ms for _, ms in plan) / 1000
+
+    def test_browse_survives_interrupted_scroll(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """_browse should log and continue when the page navigates mid-scroll."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "get", return_value=True)
+        mocker.patch.object(
+            ai.browser,
+            "execute_async_script",
+            side_effect=WebDriverException("Document was unloaded"),
+        )
+        heartbeat_mock = mocker.patch.object(ai, "_update_heartbeat")
+
+        ai._browse("https://example.com")  # Should not raise
+
+        assert heartbeat_mock.call_count == 2
+
+    def test_browse_scrolls_after_load_timeout(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """_browse should still scroll whatever rendered when the page load times out."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "get", return_value=False)
+        script_mock = mocker.patch.object(ai.browser, "execute_async_script")
+        mocker.patch.object(ai, "_update_heartbeat")
+
+        ai._browse("https://example.com")
+
+        script_mock.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            WebDriverException("Reached error page: about:neterror?e=dnsNotFound"),
+            InsecureCertificateException("Reached error page: about:certerror"),
+        ],
+    )
+    def test_browse_skips_scroll_on_error_page(
+        self, settings: Settings, mocker: MockerFixture, error: WebDriverException
+    ) -> None:
+        """_browse should skip the scroll plan when Firefox lands on an error page."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "get", side_effect=error)
+        script_mock = mocker.patch.object(ai.browser, "execute_async_script")
+        mocker.patch.object(ai, "_update_heartbeat")
+
+        ai._browse("https://example.invalid")
+
+        script_mock.assert_not_called()
+
+    def test_browse_raises_other_navigation_errors(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """_browse should let unrelated WebDriver errors reach the run loop."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(
+            ai.browser,
+            "get",
+            side_effect=WebDriverException("Browsing context discarded"),
+        )
+        with pytest.raises(WebDriverException):
+            ai._browse("https://example.com")
 
     def test_browse_updates_heartbeat(
         self, settings: Settings, mocker: MockerFixture
     ) -> None:
-        """_browse should touch the heartbeat file during scrolling."""
+        """_browse should touch the heartbeat file before and after scrolling."""
         ai = AdInfinitum(settings)
         mocker.patch.object(ai.browser, "get", return_value=True)
-        mocker.patch.object(ai.browser, "execute_script")
-        mocker.patch("adinfinitum.main.time.sleep")
+        mocker.patch.object(ai.browser, "execute_async_script")
         heartbeat_mock = mocker.patch.object(ai, "_update_heartbeat")
 
         ai._browse("https://example.com")
 
-        assert heartbeat_mock.call_count >= 2  # once after get, once per scroll step
+        assert heartbeat_mock.call_count >= 2  # once after get, once after scrolling
 
 
 class TestAdInfiniumSetup:
@@ -771,7 +1467,7 @@ class TestAdInfiniumRestart:
         ai._restart()
 
         restart_mock.assert_called_once()
-        reset_mock.assert_called_once()
+        reset_mock.assert_called_once_with(keep_profile_state=True)
         setup_mock.assert_called_once()
 
 
@@ -803,9 +1499,9 @@ class TestAdInfiniumRunLoop:
             return_value=True,
         )
 
-        # Stop after one iteration by raising on the second call to random.choice
+        # Stop after one iteration by raising on the second call to rng.choice
         call_count = 0
-        original_choice: Callable[[list[str]], str] = __import__("random").choice
+        original_choice: Callable[[list[str]], str] = ai.rng.choice
 
         def limited_choice(seq: list[str]) -> str:
             nonlocal call_count
@@ -814,13 +1510,25 @@ class TestAdInfiniumRunLoop:
                 raise KeyboardInterrupt
             return original_choice(seq)
 
-        mocker.patch("adinfinitum.main.random.choice", side_effect=limited_choice)
+        mocker.patch.object(ai.rng, "choice", side_effect=limited_choice)
 
         with pytest.raises((KeyboardInterrupt, SystemExit)):
             ai.run()
 
         assert ai.session_count == 1
 
+    def test_run_returns_once_stopped(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """run() should leave the loop without starting a session once stopped."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "start", return_value=True)
+        browse_mock = mocker.patch.object(ai, "_browse")
+        ai.stop()
+        ai.run()
+        browse_mock.assert_not_called()
+        assert ai.session_count == 0
+
     def test_run_recovers_from_loop_error(
         self, settings: Settings, mocker: MockerFixture
     ) -> None:
@@ -841,9 +1549,7 @@ class TestAdInfiniumRunLoop:
             raise KeyboardInterrupt
 
         mocker.patch.object(ai, "_browse", side_effect=browse_side_effect)
-        mocker.patch(
-            "adinfinitum.main.random.choice", return_value="https://example.com"
-        )
+        mocker.patch.object(ai.rng, "choice", return_value="https://example.com")
 
         with pytest.raises((KeyboardInterrupt, SystemExit)):
             ai.run()
@@ -851,6 +1557,60 @@ class TestAdInfiniumRunLoop:
         restart_mock.assert_called()
         reset_mock.assert_called()
 
+    def test_run_does_not_restart_after_stop(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """run() should exit rather than restart when an error arrives during shutdown."""
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "start", return_value=True)
+        restart_mock = mocker.patch.object(ai.browser, "restart")
+        mocker.patch.object(ai, "_log_resources")
+        mocker.patch.object(ai.rng, "choice", return_value="https://example.com")
+
+        def browse_side_effect(url: str) -> None:
+            ai.stop()
+            raise WebDriverException("Browser quit mid-navigation")
+
+        mocker.patch.object(ai, "_browse", side_effect=browse_side_effect)
+
+        ai.run()
+
+        restart_mock.assert_not_called()
+
+    def test_run_survives_error_page_without_restart(
+        self, settings: Settings, mocker: MockerFixture, mock_driver: MagicMock
+    ) -> None:
+        """run() should move on from a dead URL without restarting or resetting."""
+        ai = AdInfinitum(settings)
+        ai.browser.driver = mock_driver
+        mock_driver.get.side_effect = WebDriverException(
+            "Reached error page: about:neterror?e=dnsNotFound"
+        )
+        mocker.patch.object(ai.browser, "start", return_value=True)
+        restart_mock = mocker.patch.object(ai.browser, "restart")
+        reset_mock = mocker.patch.object(ai.controller, "reset")
+        mocker.patch.object(ai, "_log_resources")
+        mocker.patch.object(ai, "_update_heartbeat")
+        mocker.patch.object(ai, "_over_memory_limit", return_value=False)
+        mocker.patch.object(
+            type(ai.controller),
+            "ready",
+            new_callable=PropertyMock,
+            return_value=True,
+        )
+        mocker.patch.object(
+            ai.rng,
+            "choice",
+            side_effect=["https://example.invalid", KeyboardInterrupt],
+        )
+
+        with pytest.raises(KeyboardInterrupt):
+            ai.run()
+
+        mock_driver.execute_async_script.assert_not_called()
+        restart_mock.assert_not_called()
+        reset_mock.assert_not_called()
+
     def test_run_triggers_restart_at_interval(
         self, settings: Settings, mocker: MockerFixture
     ) -> None:
@@ -872,9 +1632,7 @@ class TestAdInfiniumRunLoop:
             return_value=True,
         )
         restart_mock = mocker.patch.object(ai, "_restart")
-        mocker.patch(
-            "adinfinitum.main.random.choice", return_value="https://example.com"
-        )
+        mocker.patch.object(ai.rng, "choice", return_value="https://example.com")
 
         call_count = 0
 
@@ -885,9 +1643,181 @@ class TestAdInfiniumRunLoop:
                 raise KeyboardInterrupt
             return "https://example.com"
 
-        mocker.patch("adinfinitum.main.random.choice", side_effect=stop_after_three)
+        mocker.patch.object(ai.rng, "choice", side_effect=stop_after_three)
+
+        with pytest.raises((KeyboardInterrupt, SystemExit)):
+            ai.run()
+
+        restart_mock.assert_called_once()
+
+    def test_run_skips_scheduled_restart_when_interval_is_zero(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """run() should only restart on memory pressure when the interval is 0."""
+        settings.session_restart_interval = 0
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "start", return_value=True)
+        mocker.patch.object(ai, "_browse")
+        mocker.patch.object(ai, "_log_resources")
+        mocker.patch.object(ai, "_over_memory_limit", side_effect=[False, True])
+        mocker.patch.object(
+            type(ai.controller),
+            "ready",
+            new_callable=PropertyMock,
+            return_value=True,
+        )
+        restart_mock = mocker.patch.object(ai, "_restart")
+
+        call_count = 0
+
+        def stop_after_two(*args: object) -> str:
+            nonlocal call_count
+            call_count += 1
+            if call_count > 2:
+                raise KeyboardInterrupt
+            return "https://example.com"
+
+        mocker.patch.object(ai.rng, "choice", side_effect=stop_after_two)
+
+        with pytest.raises((KeyboardInterrupt, SystemExit)):
+            ai.run()
+
+        restart_mock.assert_called_once()
+
+    def test_run_minimizes_memory_between_restarts(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """run() should minimise memory every memory_minimize_interval sessions."""
+        settings.memory_minimize_interval = 2
+        settings.session_restart_interval = 4
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "start", return_value=True)
+        mocker.patch.object(ai, "_browse")
+        mocker.patch.object(ai, "_log_resources")
+        mocker.patch.object(
+            ai.controller,
+            "scrape_vault",
+            return_value=("clicked 0", "0 ads collected", "0"),
+        )
+        mocker.patch.object(
+            type(ai.controller),
+            "ready",
+            new_callable=PropertyMock,
+            return_value=True,
+        )
+        restart_mock = mocker.patch.object(ai, "_restart")
+        minimize_mock = mocker.patch.object(ai.browser, "minimize_memory")
+
+        call_count = 0
+
+        def stop_after_four(*args: object) -> str:
+            nonlocal call_count
+            call_count += 1
+            if call_count > 4:
+                raise KeyboardInterrupt
+            return "https://example.com"
+
+        mocker.patch.object(ai.rng, "choice", side_effect=stop_after_four)
 
         with pytest.raises((KeyboardInterrupt, SystemExit)):
             ai.run()
 
+        minimize_mock.assert_called_once()
         restart_mock.assert_called_once()
+
+    def test_run_scrapes_vault_at_interval(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """run() should only scrape the vault every vault_scrape_interval sessions."""
+        settings.vault_scrape_interval = 3
+        ai = AdInfinitum(settings)
+        mocker.patch.object(ai.browser, "start", return_value=True)
+        mocker.patch.object(ai, "_browse")
+        mocker.patch.object(ai, "_log_resources")
+        scrape_mock = mocker.patch.object(
+            ai.controller,
+            "scrape_vault",
+            return_value=("clicked 0", "0 ads collected", "0"),
+        )
+        mocker.patch.object(
+            type(ai.controller),
+            "ready",
+            new_callable=PropertyMock,
+            return_value=True,
+        )
+
+        call_count = 0
+
+        def stop_after_six(*args: object) -> str:
+            nonlocal call_count
+            call_count += 1
+            if call_count > 6:
+                raise KeyboardInterrupt
+            return "https://example.com"
+
+        mocker.patch.object(ai.rng, "choice", side_effect=stop_after_six)
+
+        with pytest.raises((KeyboardInterrupt, SystemExit)):
+            ai.run()
+
+        assert scrape_mock.call_count == 2
+
+
+class TestMain:
+    """Tests for main() — worker orchestration."""
+
+    def test_main_runs_single_worker_inline(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """main() should run a single worker on the calling thread."""
+        mocker.patch("adinfinitum.main.signal.signal")
+        run_mock = mocker.patch("adinfinitum.main.AdInfinitum.run")
+        thread_mock = mocker.patch("adinfinitum.main.threading.Thread")
+        main(settings)
+        run_mock.assert_called_once()
+        thread_mock.assert_not_called()
+
+    def test_main_starts_one_thread_per_worker(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """main() should start one thread per worker and exit non-zero once one exits."""
+        settings.workers = 3
+        mocker.patch("adinfinitum.main.signal.signal")
+        kill_mock = mocker.patch("adinfinitum.main.BrowserManager._kill_orphans")
+        run_mock = mocker.patch("adinfinitum.main.AdInfinitum.run")
+        sleep_mock = mocker.patch("adinfinitum.main.time.sleep")
+        error_mock = mocker.patch("adinfinitum.main.log.error")
+
+        def fake_thread(
+            target: Callable[..., None], args: tuple[object, ...], **kwargs: object
+        ) -> MagicMock:
+            thread = MagicMock()
+            thread.start.side_effect = lambda: target(*args)
+            return thread
+
+        thread_mock = mocker.patch(
+            "adinfinitum.main.threading.Thread", side_effect=fake_thread
+        )
+        with pytest.raises(SystemExit) as exc_info:
+            main(settings)
+        assert exc_info.value.code == 1
+        kill_mock.assert_called_once()
+        assert thread_mock.call_count == 3
+        assert run_mock.call_count == 3
+        assert sleep_mock.call_count == 2  # staggered between launches
+        error_mock.assert_any_call("Worker exited")
+
+    def test_main_stops_browsers_on_shutdown(
+        self, settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """main() should quit every worker's browser when a signal ends the run."""
+        settings.workers = 2
+        mocker.patch("adinfinitum.main.signal.signal")
+        mocker.patch("adinfinitum.main.BrowserManager._kill_orphans")
+        mocker.patch("adinfinitum.main.threading.Thread")
+        mocker.patch("adinfinitum.main.threading.Event.wait", side_effect=SystemExit(0))
+        mocker.patch("adinfinitum.main.time.sleep")
+        stop_mock = mocker.patch("adinfinitum.main.BrowserManager.stop")
+        with pytest.raises(SystemExit):
+            main(settings)
+        assert stop_mock.call_count == 2